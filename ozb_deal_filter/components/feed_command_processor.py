@@ -19,6 +19,41 @@ logger = get_logger("feed_command_processor")
 class FeedCommandProcessor:
     """Processes feed management commands from Telegram bot."""
 
+    # Static replies are built once rather than on every command
+    _HELP_MESSAGE = """🤖 **OzBargain Deal Filter Bot**
+
+**Available Commands:**
+
+📥 `/add_feed <url> [name]`
+   Add a new RSS feed to monitor
+   *Example:* `/add_feed https://www.ozbargain.com.au/deals/feed OzBargain`
+
+🗑️ `/remove_feed <url>`
+   Remove an RSS feed from monitoring
+   *Example:* `/remove_feed https://www.ozbargain.com.au/deals/feed`
+
+📋 `/list_feeds`
+   Show all active RSS feeds
+
+📊 `/feed_status [url]`
+   Get monitoring status for all feeds or a specific feed
+
+❓ `/help`
+   Show this help message
+
+**Notes:**
+• Only authorized users can manage feeds
+• RSS feeds must be publicly accessible
+• Feed changes are applied immediately
+• Use valid RSS/XML feed URLs"""
+
+    _STATUS_TEMPLATE = (
+        "{emoji} **RSS Monitor Status**\n\n"
+        "**Total Feeds:** {total_feeds}\n"
+        "**Active Feeds:** {active_feeds}\n"
+        "**Monitor Status:** {monitor_state}\n\n"
+    )
+
     def __init__(self, rss_monitor: IRSSMonitor, feed_manager: IDynamicFeedManager):
         """
         Initialize feed command processor.
@@ -33,6 +68,23 @@ class FeedCommandProcessor:
 
         logger.info("Feed command processor initialized")
 
+    async def open(self) -> None:
+        """Open a URL validator session that is reused across commands."""
+        await self.url_validator.__aenter__()
+
+    async def close(self) -> None:
+        """Close the shared URL validator session, if open."""
+        await self.url_validator.__aexit__(None, None, None)
+
+    async def __aenter__(self) -> "FeedCommandProcessor":
+        """Async context manager entry."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
     async def process_command(self, command: BotCommand) -> CommandResult:
         """
         Route command to appropriate handler.
@@ -101,9 +153,12 @@ class FeedCommandProcessor:
             url = command.args[0].strip()
             name = " ".join(command.args[1:]).strip() if len(command.args) > 1 else None
 
-            # Validate URL
-            async with self.url_validator as validator:
-                validation_result = await validator.validate_url(url)
+            # Validate URL, reusing the shared session when the processor is open
+            if self.url_validator.session is not None:
+                validation_result = await self.url_validator.validate_url(url)
+            else:
+                async with self.url_validator as validator:
+                    validation_result = await validator.validate_url(url)
 
             if not validation_result.is_valid:
                 return CommandResult(
@@ -322,11 +377,11 @@ class FeedCommandProcessor:
             # Format status message
             status_emoji = "✅" if monitor_active and total_feeds > 0 else "⚠️"
 
-            message = f"{status_emoji} **RSS Monitor Status**\n\n"
-            message += f"**Total Feeds:** {total_feeds}\n"
-            message += f"**Active Feeds:** {active_feeds}\n"
-            message += (
-                f"**Monitor Status:** {'Running' if monitor_active else 'Stopped'}\n\n"
+            message = self._STATUS_TEMPLATE.format(
+                emoji=status_emoji,
+                total_feeds=total_feeds,
+                active_feeds=active_feeds,
+                monitor_state="Running" if monitor_active else "Stopped",
             )
 
             if total_feeds == 0:
@@ -378,36 +433,7 @@ class FeedCommandProcessor:
         Returns:
             CommandResult with help message
         """
-        help_text = """
-🤖 **OzBargain Deal Filter Bot**
-
-**Available Commands:**
-
-📥 `/add_feed <url> [name]`
-   Add a new RSS feed to monitor
-   *Example:* `/add_feed https://www.ozbargain.com.au/deals/feed OzBargain`
-
-🗑️ `/remove_feed <url>`
-   Remove an RSS feed from monitoring
-   *Example:* `/remove_feed https://www.ozbargain.com.au/deals/feed`
-
-📋 `/list_feeds`
-   Show all active RSS feeds
-
-📊 `/feed_status [url]`
-   Get monitoring status for all feeds or a specific feed
-
-❓ `/help`
-   Show this help message
-
-**Notes:**
-• Only authorized users can manage feeds
-• RSS feeds must be publicly accessible
-• Feed changes are applied immediately
-• Use valid RSS/XML feed URLs
-        """
-
-        return CommandResult(success=True, message=help_text.strip())
+        return CommandResult(success=True, message=self._HELP_MESSAGE)
 
     def _extract_domain_name(self, url: str) -> str:
         """
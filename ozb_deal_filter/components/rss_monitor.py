@@ -24,6 +24,20 @@ from ..models.deal import RawDeal
 logger = logging.getLogger(__name__)
 
 
+def _deal_key(link: str) -> int:
+    """
+    Derive a compact, process-stable 64-bit key for a deal link.
+
+    Args:
+        link: Deal URL used as the unique identifier
+
+    Returns:
+        Unsigned 64-bit integer key
+    """
+    digest = hashlib.blake2b(link.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
 class FeedPoller:
     """Individual RSS feed polling and management."""
 
@@ -50,7 +64,9 @@ class FeedPoller:
 
         # Track last successful poll and feed state
         self.last_poll_time: Optional[datetime] = None
-        self.last_feed_hash: Optional[str] = None
+        self.last_feed_hash: Optional[int] = None
+        self.last_etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
         self.consecutive_failures = 0
         self.is_active = False
 
@@ -74,15 +90,37 @@ class FeedPoller:
         """
         Fetch RSS feed content with error handling.
 
+        Sends conditional GET headers from the previous response so an
+        unchanged feed is answered with 304 Not Modified and no body.
+
         Returns:
-            Feed content as string, or None if failed
+            Feed content as string, or None if failed or not modified
         """
         try:
             logger.debug(f"Fetching RSS feed: {self.feed_url}")
 
-            response = self.session.get(self.feed_url, timeout=self.timeout)
+            headers = {}
+            if self.last_etag:
+                headers["If-None-Match"] = self.last_etag
+            if self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+
+            response = self.session.get(
+                self.feed_url, timeout=self.timeout, headers=headers
+            )
+
+            if response.status_code == 304:
+                logger.debug(f"Feed not modified since last poll: {self.feed_url}")
+                self.consecutive_failures = 0
+                self.last_poll_time = datetime.now()
+                return None
+
             response.raise_for_status()
 
+            # Remember validators for the next conditional request
+            self.last_etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
+
             # Reset failure counter on success
             self.consecutive_failures = 0
             self.last_poll_time = datetime.now()
@@ -131,7 +169,9 @@ class FeedPoller:
         Returns:
             True if feed has changed or is first poll
         """
-        current_hash = hashlib.md5(feed_content.encode()).hexdigest()
+        # Change detection only needs an in-process fingerprint, not a
+        # cryptographic digest, so the builtin string hash is sufficient
+        current_hash = hash(feed_content)
 
         if self.last_feed_hash is None:
             self.last_feed_hash = current_hash
@@ -180,7 +220,7 @@ class DealDetector:
         """
         self.state_file = Path(state_file)
         self.max_age_hours = max_age_hours
-        self.seen_deal_ids: Set[str] = set()
+        self.seen_deal_ids: Set[int] = set()
         self.last_cleanup = datetime.now()
 
         # Load existing state
@@ -222,7 +262,8 @@ class DealDetector:
                         continue
 
                     # Check if we've already seen this deal
-                    if deal_id in self.seen_deal_ids:
+                    deal_key = _deal_key(deal_id)
+                    if deal_key in self.seen_deal_ids:
                         continue
 
                     # Parse publication date to check if deal is recent enough
@@ -259,7 +300,7 @@ class DealDetector:
                     # Validate raw deal
                     if raw_deal.validate():
                         new_deals.append(raw_deal)
-                        self.seen_deal_ids.add(deal_id)
+                        self.seen_deal_ids.add(deal_key)
                         logger.debug(f"New deal detected: {raw_deal.title}")
 
                 except Exception as e:
@@ -315,7 +356,11 @@ class DealDetector:
             if self.state_file.exists():
                 with open(self.state_file, "r") as f:
                     data = json.load(f)
-                    self.seen_deal_ids = set(data.get("seen_deals", []))
+                    # Older state files stored raw links; key them on load
+                    self.seen_deal_ids = {
+                        _deal_key(item) if isinstance(item, str) else item
+                        for item in data.get("seen_deals", [])
+                    }
                     logger.debug(
                         f"Loaded {len(self.seen_deal_ids)} seen deals from {self.state_file}"
                     )
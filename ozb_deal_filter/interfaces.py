@@ -186,6 +186,14 @@ class IFeedCommandProcessor(Protocol):
         """Show help information."""
         ...
 
+    async def open(self) -> None:
+        """Open resources shared across commands."""
+        ...
+
+    async def close(self) -> None:
+        """Release resources shared across commands."""
+        ...
+
 
 class IDynamicFeedManager(Protocol):
     """Protocol for managing dynamic feed configurations."""
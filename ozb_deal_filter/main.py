@@ -8,6 +8,11 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+try:
+    import uvloop
+except ImportError:  # Optional, faster event loop; not available on Windows
+    uvloop = None
+
 from .orchestrator import ApplicationOrchestrator
 from .utils.logging import get_logger, setup_logging
 
@@ -40,6 +45,9 @@ def main():
     if len(sys.argv) > 1:
         config_path = sys.argv[1]
 
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Run the async application
     try:
         asyncio.run(async_main(config_path))
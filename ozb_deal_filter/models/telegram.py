@@ -10,6 +10,11 @@ from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urlparse
 
+# Commands understood by the feed command processor
+_VALID_COMMANDS = frozenset(
+    {"add_feed", "remove_feed", "list_feeds", "feed_status", "help"}
+)
+
 
 @dataclass
 class TelegramUser:
@@ -72,15 +77,8 @@ class BotCommand:
 
     def validate(self) -> bool:
         """Validate command structure."""
-        valid_commands = [
-            "add_feed",
-            "remove_feed",
-            "list_feeds",
-            "feed_status",
-            "help",
-        ]
         return (
-            self.command in valid_commands
+            self.command in _VALID_COMMANDS
             and isinstance(self.args, list)
             and bool(self.user_id and self.user_id.strip())
             and bool(self.chat_id and self.chat_id.strip())
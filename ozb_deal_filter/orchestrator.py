@@ -8,9 +8,11 @@ managing their lifecycle, error handling, and graceful shutdown.
 import asyncio
 import signal
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .components.alert_formatter import AlertFormatter
 from .components.deal_parser import DealParser
@@ -64,6 +66,15 @@ class ApplicationOrchestrator:
     and shutdown, and provides error recovery mechanisms.
     """
 
+    # Seconds during which a completed health check is reused
+    HEALTH_CHECK_TTL = 1.0
+
+    # Seconds during which a get_system_status() snapshot is reused
+    STATUS_CACHE_TTL = 1.0
+
+    # Components the system cannot operate without; others may run degraded
+    _CRITICAL_COMPONENTS = frozenset({"config_manager", "rss_monitor", "deal_parser"})
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the application orchestrator.
@@ -78,6 +89,8 @@ class ApplicationOrchestrator:
         self.config_path = config_path
         self._running = False
         self._shutdown_event = asyncio.Event()
+        self._shutdown_lock = asyncio.Lock()
+        self._signal_shutdown: Optional[asyncio.Task] = None
 
         # Error handling and monitoring
         self.error_tracker = get_error_tracker()
@@ -103,6 +116,13 @@ class ApplicationOrchestrator:
         self._startup_time: Optional[datetime] = None
         self._component_health: Dict[str, bool] = {}
         self._error_counts: Dict[str, int] = {}
+        self._last_health_check: Optional[float] = None
+        self._status_cache: Optional[Tuple[float, datetime, Dict[str, Any]]] = None
+
+        # Worker threads for blocking component calls; released on shutdown
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="orchestrator"
+        )
 
         # Setup signal handlers
         self._setup_signal_handlers()
@@ -124,7 +144,9 @@ class ApplicationOrchestrator:
             "Received shutdown signal, initiating graceful shutdown",
             extra={"signal": signum},
         )
-        asyncio.create_task(self.shutdown())
+        # Keep a reference so the task is not collected mid-shutdown; run()
+        # waits for it through shutdown()'s lock
+        self._signal_shutdown = asyncio.create_task(self.shutdown())
 
     @with_error_handling(
         component="orchestrator",
@@ -314,6 +336,7 @@ class ApplicationOrchestrator:
             self._feed_command_processor = FeedCommandProcessor(
                 rss_monitor=self._rss_monitor, feed_manager=self._dynamic_feed_manager
             )
+            await self._feed_command_processor.open()
             self._component_health["feed_command_processor"] = True
             self.logger.info("Feed command processor initialized")
 
@@ -384,36 +407,21 @@ class ApplicationOrchestrator:
     async def _validate_components(self) -> bool:
         """Validate that all components are working correctly."""
         try:
-            # Test message dispatcher connection
-            if not self._message_dispatcher.test_connection():
-                self.logger.warning("Message dispatcher connection test failed")
-                self._component_health["message_dispatcher"] = False
-
-            # Test LLM evaluator (if available)
-            try:
-                test_deal = Deal(
-                    id="test",
-                    title="Test Deal",
-                    description="Test description",
-                    price=100.0,
-                    original_price=200.0,
-                    discount_percentage=50.0,
-                    category="Test",
-                    url="https://example.com",
-                    timestamp=datetime.now(),
-                    votes=10,
-                    comments=5,
-                    urgency_indicators=[],
-                )
-
-                result = await self._evaluation_service.evaluate_deal(test_deal)
-                if result is None:
-                    self.logger.warning("LLM evaluation test failed")
-                    self._component_health["llm_evaluator"] = False
+            # The probes are independent, so run them concurrently and wait
+            # for the slowest one rather than their sum
+            dispatcher_result, llm_result = await asyncio.gather(
+                self._probe_message_dispatcher(),
+                self._probe_llm_evaluator(),
+                return_exceptions=True,
+            )
 
-            except Exception as e:
-                self.logger.warning(f"LLM evaluation test failed: {e}")
+            # An LLM failure only degrades the system, but a dispatcher that
+            # cannot even be tested fails validation
+            if isinstance(llm_result, Exception):
+                self.logger.warning(f"LLM evaluation test failed: {llm_result}")
                 self._component_health["llm_evaluator"] = False
+            if isinstance(dispatcher_result, BaseException):
+                raise dispatcher_result
 
             # Log component health status
             healthy_components = sum(
@@ -427,8 +435,7 @@ class ApplicationOrchestrator:
             )
 
             # System can operate with some components degraded
-            critical_components = ["config_manager", "rss_monitor", "deal_parser"]
-            for component in critical_components:
+            for component in self._CRITICAL_COMPONENTS:
                 if not self._component_health.get(component, False):
                     self.logger.error(
                         f"Critical component '{component}' is not healthy"
@@ -441,6 +448,46 @@ class ApplicationOrchestrator:
             self.logger.error(f"Component validation failed: {e}", exc_info=True)
             return False
 
+    async def _dispatcher_connected(self) -> bool:
+        """
+        Run the message dispatcher's blocking connection test on the executor.
+
+        Every dispatcher implements the synchronous ``IMessageDispatcher``
+        protocol over ``requests``, so the call is kept off the event loop
+        on the orchestrator's own executor, which shutdown() releases.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._message_dispatcher.test_connection
+        )
+
+    async def _probe_message_dispatcher(self) -> None:
+        """Mark the message dispatcher unhealthy if its connection test fails."""
+        if not await self._dispatcher_connected():
+            self.logger.warning("Message dispatcher connection test failed")
+            self._component_health["message_dispatcher"] = False
+
+    async def _probe_llm_evaluator(self) -> None:
+        """Mark the LLM evaluator unhealthy if a test evaluation fails."""
+        test_deal = Deal(
+            id="test",
+            title="Test Deal",
+            description="Test description",
+            price=100.0,
+            original_price=200.0,
+            discount_percentage=50.0,
+            category="Test",
+            url="https://example.com",
+            timestamp=datetime.now(),
+            votes=10,
+            comments=5,
+            urgency_indicators=[],
+        )
+
+        result = await self._evaluation_service.evaluate_deal(test_deal)
+        if result is None:
+            self.logger.warning("LLM evaluation test failed")
+            self._component_health["llm_evaluator"] = False
+
     async def start(self) -> None:
         """Start the main application loop."""
         if self._running:
@@ -464,7 +511,7 @@ class ApplicationOrchestrator:
                     await self._health_check()
 
                     # Wait before next iteration
-                    await asyncio.sleep(30)  # Check every 30 seconds
+                    await self._wait_for_shutdown(30)  # Check every 30 seconds
 
                 except Exception as e:
                     self.logger.error(f"Error in main loop: {e}", exc_info=True)
@@ -750,20 +797,40 @@ class ApplicationOrchestrator:
                 urgency_level=urgency,
             )
 
-    async def _health_check(self) -> None:
-        """Perform periodic health checks on components."""
+    async def _health_check(self, force: bool = False) -> None:
+        """
+        Perform periodic health checks on components.
+
+        Results stay in ``_component_health`` and are reused for
+        ``HEALTH_CHECK_TTL`` seconds so back-to-back calls don't re-probe.
+
+        Args:
+            force: Probe components even if the last check is still fresh.
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_health_check is not None
+            and now - self._last_health_check < self.HEALTH_CHECK_TTL
+        ):
+            return
+        self._last_health_check = now
+
         try:
             # Check RSS monitor health
             self._component_health["rss_monitor"] = self._rss_monitor.is_monitoring
 
-            # Check message dispatcher health
-            if self._component_health.get("message_dispatcher", False):
+            # Check message dispatcher health; an unhealthy one can recover
+            if self._message_dispatcher:
                 try:
-                    if not self._message_dispatcher.test_connection():
-                        self._component_health["message_dispatcher"] = False
-                        self.logger.warning("Message dispatcher health check failed")
+                    connected = await self._dispatcher_connected()
                 except Exception:
-                    self._component_health["message_dispatcher"] = False
+                    connected = False
+                if not connected:
+                    self.logger.warning("Message dispatcher health check failed")
+                elif not self._component_health.get("message_dispatcher", False):
+                    self.logger.info("Message dispatcher recovered")
+                self._component_health["message_dispatcher"] = connected
 
             # Log health status periodically
             unhealthy_components = [
@@ -796,13 +863,43 @@ class ApplicationOrchestrator:
             await self.shutdown()
         else:
             # Wait before retrying
-            await asyncio.sleep(30)
+            await self._wait_for_shutdown(30)
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """
+        Wait until shutdown is requested or ``timeout`` seconds pass.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            True if shutdown was requested during the wait.
+        """
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     async def shutdown(self) -> None:
-        """Gracefully shutdown the system."""
-        if not self._running:
-            return
+        """
+        Gracefully shutdown the system.
 
+        Calls are serialized, so a caller that arrives while another shutdown
+        is stopping components waits for it instead of releasing shared
+        resources underneath it.
+        """
+        async with self._shutdown_lock:
+            try:
+                if self._running:
+                    await self._stop_components()
+            finally:
+                # Even a system that never started may hold sessions opened
+                # by initialize()
+                await self._release_resources()
+
+    async def _stop_components(self) -> None:
+        """Stop the running components and wake the main loop."""
         self.logger.info("Initiating graceful shutdown...")
         self._running = False
         self._shutdown_event.set()
@@ -831,19 +928,88 @@ class ApplicationOrchestrator:
         except Exception as e:
             self.logger.error(f"Error during shutdown: {e}", exc_info=True)
 
+    async def _release_resources(self) -> None:
+        """Close shared sessions and worker threads; safe to call repeatedly."""
+        if self._feed_command_processor:
+            try:
+                await self._feed_command_processor.close()
+            except Exception as e:
+                self.logger.error(f"Error closing feed command processor: {e}")
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> "ApplicationOrchestrator":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit; shuts down even if never started."""
+        await self.shutdown()
+
+    def get_liveness(self) -> Dict[str, bool]:
+        """Get a constant-time liveness view that skips component checks."""
+        return {"alive": self._running}
+
+    def is_ready(self) -> bool:
+        """Check whether every critical component is healthy."""
+        health = self._component_health
+        return all(
+            health.get(component, False) for component in self._CRITICAL_COMPONENTS
+        )
+
+    def _cached_status(self, now: float) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached status snapshot if it is still valid.
+
+        A snapshot is valid for ``STATUS_CACHE_TTL`` seconds and only while the
+        state it was built from is unchanged, so no write needs to clear it.
+        """
+        if self._status_cache is None:
+            return None
+
+        cached_at, startup_time, status = self._status_cache
+        if (
+            now - cached_at < self.STATUS_CACHE_TTL
+            and startup_time == self._startup_time
+            and status["running"] == self._running
+            and status["config_loaded"] == (self._config is not None)
+            and status["component_health"] == self._component_health
+            and status["error_counts"] == self._error_counts
+        ):
+            return status
+        return None
+
     def get_system_status(self) -> Dict[str, Any]:
-        """Get current system status information."""
+        """
+        Get current system status information.
+
+        Once the system has started, a snapshot is reused for
+        ``STATUS_CACHE_TTL`` seconds while component state is unchanged, so
+        frequent status polling stays cheap. Only ``uptime`` can lag.
+        """
+        now = time.monotonic()
+        status = self._cached_status(now)
+        if status is None:
+            status = {
+                "running": self._running,
+                "startup_time": self._startup_time.isoformat()
+                if self._startup_time
+                else None,
+                "uptime": str(datetime.now() - self._startup_time)
+                if self._startup_time
+                else None,
+                "component_health": self._component_health.copy(),
+                "error_counts": self._error_counts.copy(),
+                "config_loaded": self._config is not None,
+                "ready": self.is_ready(),
+            }
+            if self._startup_time:
+                self._status_cache = (now, self._startup_time, status)
+
+        # Copy so callers cannot alter the cached snapshot
         return {
-            "running": self._running,
-            "startup_time": self._startup_time.isoformat()
-            if self._startup_time
-            else None,
-            "uptime": str(datetime.now() - self._startup_time)
-            if self._startup_time
-            else None,
-            "component_health": self._component_health.copy(),
-            "error_counts": self._error_counts.copy(),
-            "config_loaded": self._config is not None,
+            **status,
+            "component_health": status["component_health"].copy(),
+            "error_counts": status["error_counts"].copy(),
         }
 
     async def run(self) -> None:
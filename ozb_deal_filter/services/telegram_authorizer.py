@@ -5,7 +5,7 @@ This module provides user authorization and rate limiting functionality
 for Telegram bot operations.
 """
 
-from typing import List, Set
+from typing import FrozenSet, List
 
 from ..models.telegram import AuthResult
 from ..utils.logging import get_logger
@@ -31,7 +31,9 @@ class TelegramAuthorizer:
             global_max_commands_per_minute: Global command rate limit
             user_max_commands_per_minute: Per-user command rate limit
         """
-        self.authorized_users: Set[str] = set(authorized_users)
+        # Immutable snapshot: lookups never race with add/remove, which swap
+        # in a new frozenset instead of mutating this one
+        self.authorized_users: FrozenSet[str] = frozenset(authorized_users)
         self.rate_limiter = MultiUserRateLimiter(
             global_max_requests=global_max_commands_per_minute,
             global_time_window=60.0,  # 1 minute
@@ -101,7 +103,7 @@ class TelegramAuthorizer:
                 logger.info(f"User already authorized: {user_id}")
                 return True
 
-            self.authorized_users.add(user_id)
+            self.authorized_users = self.authorized_users | {user_id}
             logger.info(f"Added authorized user: {user_id}")
             return True
 
@@ -124,7 +126,7 @@ class TelegramAuthorizer:
                 logger.info(f"User not in authorized list: {user_id}")
                 return True
 
-            self.authorized_users.remove(user_id)
+            self.authorized_users = self.authorized_users - {user_id}
             logger.info(f"Removed authorized user: {user_id}")
             return True
 
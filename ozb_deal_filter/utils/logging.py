@@ -197,6 +197,8 @@ class LoggingManager:
                 logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
             )
 
+            # Replace handlers from earlier setups instead of stacking them
+            component_logger.handlers.clear()
             component_logger.addHandler(component_handler)
 
     def get_component_logger(
@@ -15,7 +15,12 @@ logger = get_logger("rate_limiter")
 
 
 class TokenBucket:
-    """Token bucket rate limiter implementation."""
+    """
+    Token bucket rate limiter implementation.
+
+    Refills are computed from ``time.monotonic()`` so each check is O(1) and
+    unaffected by wall-clock adjustments such as NTP corrections.
+    """
 
     def __init__(
         self, capacity: int, refill_rate: float, initial_tokens: Optional[int] = None
@@ -31,7 +36,7 @@ class TokenBucket:
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = initial_tokens if initial_tokens is not None else capacity
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
     async def consume(self, tokens: int = 1) -> bool:
@@ -54,7 +59,7 @@ class TokenBucket:
 
     async def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_refill
 
         if elapsed > 0:
@@ -81,13 +86,13 @@ class TokenBucket:
         Returns:
             True if tokens became available, False if timeout
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         while True:
             if await self.consume(tokens):
                 return True
 
-            if timeout and (time.time() - start_time) >= timeout:
+            if timeout and (time.monotonic() - start_time) >= timeout:
                 return False
 
             # Calculate wait time until next token
@@ -156,7 +161,7 @@ class MultiUserRateLimiter:
         self.user_max_requests = user_max_requests
         self.user_time_window = user_time_window
         self._cleanup_interval = 300  # 5 minutes
-        self._last_cleanup = time.time()
+        self._last_cleanup = time.monotonic()
 
     async def allow_request(self, user_id: str) -> bool:
         """
@@ -194,7 +199,7 @@ class MultiUserRateLimiter:
 
     async def _cleanup_if_needed(self) -> None:
         """Clean up old user limiters periodically."""
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_cleanup > self._cleanup_interval:
             # Remove limiters that haven't been used recently
             # For simplicity, we'll just clear all and let them recreate
@@ -9,7 +9,7 @@ import asyncio
 import ipaddress
 import re
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
 import aiohttp
 import feedparser
@@ -20,6 +20,20 @@ from ..utils.logging import get_logger
 
 logger = get_logger("url_validator")
 
+# Compiled once at import; validation runs for every /add_feed command
+_ALLOWED_SCHEMES = frozenset({"http", "https"})
+_INVALID_CHARS_RE = re.compile(r'[<>"\s]')
+_LOCALHOST_NAMES = frozenset({"localhost", "127.0.0.1", "::1", "0.0.0.0"})  # nosec B104
+_SUSPICIOUS_HOST_RE = re.compile(
+    r"\.local$"
+    r"|\.internal$"
+    r"|\.corp$"
+    r"|192\.168\."
+    r"|10\."
+    r"|172\.(1[6-9]|2[0-9]|3[0-1])\.",
+    re.IGNORECASE,
+)
+
 
 class URLValidator:
     """Service for validating URLs and RSS feeds."""
@@ -38,7 +52,10 @@ class URLValidator:
         """Async context manager entry."""
         if self.session is None:
             timeout = ClientTimeout(total=self.timeout)
+            # Pool connections and cache DNS so a long-lived session reuses them
+            connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
             self.session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=timeout,
                 headers={"User-Agent": "OzBargain-Deal-Filter/1.0 (Feed Validator)"},
             )
@@ -61,15 +78,10 @@ class URLValidator:
             ValidationResult with validation status and details
         """
         try:
-            # 1. Format validation
-            format_result = self._validate_format(url)
-            if not format_result.is_valid:
-                return format_result
-
-            # 2. Security checks
-            security_result = self._validate_security(url)
-            if not security_result.is_valid:
-                return security_result
+            # 1-2. Format and security checks on a single parse
+            static_result = self._validate(url)
+            if not static_result.is_valid:
+                return static_result
 
             # 3. Accessibility check
             if not await self.is_accessible(url):
@@ -90,12 +102,36 @@ class URLValidator:
             logger.error(f"Error validating URL {url}: {e}")
             return ValidationResult(is_valid=False, error=f"Validation error: {str(e)}")
 
-    def _validate_format(self, url: str) -> ValidationResult:
+    def _validate(self, url: str) -> ValidationResult:
+        """
+        Run format and security validation sharing one parse of the URL.
+
+        Args:
+            url: URL to validate
+
+        Returns:
+            The first failing ValidationResult, or a valid one
+        """
+        try:
+            parsed = urlparse(url)
+        except ValueError as e:
+            return ValidationResult(is_valid=False, error=f"URL format error: {str(e)}")
+
+        format_result = self._validate_format(url, parsed)
+        if not format_result.is_valid:
+            return format_result
+
+        return self._validate_security(url, parsed)
+
+    def _validate_format(
+        self, url: str, parsed: Optional[ParseResult] = None
+    ) -> ValidationResult:
         """
         Validate URL format.
 
         Args:
             url: URL to validate
+            parsed: Result of ``urlparse(url)``, if already available
 
         Returns:
             ValidationResult with format validation status
@@ -108,10 +144,11 @@ class URLValidator:
                 )
 
             # Parse URL
-            parsed = urlparse(url)
+            if parsed is None:
+                parsed = urlparse(url)
 
             # Check scheme
-            if parsed.scheme not in ["http", "https"]:
+            if parsed.scheme not in _ALLOWED_SCHEMES:
                 return ValidationResult(
                     is_valid=False, error="URL must use HTTP or HTTPS scheme"
                 )
@@ -123,8 +160,7 @@ class URLValidator:
                 )
 
             # Check for invalid characters
-            invalid_chars = re.search(r'[<>"\s]', url)
-            if invalid_chars:
+            if _INVALID_CHARS_RE.search(url):
                 return ValidationResult(
                     is_valid=False, error="URL contains invalid characters"
                 )
@@ -134,18 +170,22 @@ class URLValidator:
         except Exception as e:
             return ValidationResult(is_valid=False, error=f"URL format error: {str(e)}")
 
-    def _validate_security(self, url: str) -> ValidationResult:
+    def _validate_security(
+        self, url: str, parsed: Optional[ParseResult] = None
+    ) -> ValidationResult:
         """
         Validate URL for security concerns.
 
         Args:
             url: URL to validate
+            parsed: Result of ``urlparse(url)``, if already available
 
         Returns:
             ValidationResult with security validation status
         """
         try:
-            parsed = urlparse(url)
+            if parsed is None:
+                parsed = urlparse(url)
             hostname = parsed.hostname
 
             if not hostname:
@@ -154,14 +194,7 @@ class URLValidator:
                 )
 
             # Check for localhost
-            localhost_patterns = [
-                "localhost",
-                "127.0.0.1",
-                "::1",
-                "0.0.0.0",
-            ]  # nosec B104
-
-            if hostname.lower() in localhost_patterns:
+            if hostname.lower() in _LOCALHOST_NAMES:
                 return ValidationResult(
                     is_valid=False, error="Localhost URLs are not allowed"
                 )
@@ -179,20 +212,10 @@ class URLValidator:
                 pass
 
             # Check for suspicious domains
-            suspicious_patterns = [
-                r"\.local$",
-                r"\.internal$",
-                r"\.corp$",
-                r"192\.168\.",
-                r"10\.",
-                r"172\.(1[6-9]|2[0-9]|3[0-1])\.",
-            ]
-
-            for pattern in suspicious_patterns:
-                if re.search(pattern, hostname, re.IGNORECASE):
-                    return ValidationResult(
-                        is_valid=False, error="Internal/private domains are not allowed"
-                    )
+            if _SUSPICIOUS_HOST_RE.search(hostname):
+                return ValidationResult(
+                    is_valid=False, error="Internal/private domains are not allowed"
+                )
 
             return ValidationResult(is_valid=True)
 
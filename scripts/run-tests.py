@@ -108,6 +108,8 @@ class TestRunner:
             cmd.extend(["-n", str(num_workers)])
         else:
             cmd.extend(["-n", "auto"])
+        # Honour @pytest.mark.xdist_group so grouped classes share one worker
+        cmd.extend(["--dist", "loadgroup"])
         return self.run_command(cmd, "Parallel tests")
 
     def run_specific_test(self, test_path: str, verbose: bool = False) -> bool:
@@ -129,7 +131,7 @@ class TestRunner:
         cmd = ["pytest"]
 
         if parallel:
-            cmd.extend(["-n", "auto"])
+            cmd.extend(["-n", "auto", "--dist", "loadgroup"])
 
         if verbose:
             cmd.append("-v")
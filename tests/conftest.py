@@ -5,14 +5,21 @@ This module provides common fixtures and configuration for all tests
 in the OzBargain Deal Filter test suite.
 """
 
+import importlib.resources
 import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
+import feedparser
 import pytest
 
+try:
+    import looptime
+except ImportError:  # Dev-only; tests that need it skip themselves
+    looptime = None
+
 from ozb_deal_filter.models.alert import FormattedAlert
 from ozb_deal_filter.models.config import Configuration, UserCriteria
 from ozb_deal_filter.models.deal import Deal, RawDeal
@@ -189,6 +196,46 @@ def mock_rss_feed():
     </rss>"""
 
 
+@pytest.fixture
+def mock_session_get():
+    """Patch requests.Session.get for the duration of a test."""
+    with patch("requests.Session.get") as mock_get:
+        yield mock_get
+
+
+@pytest.fixture
+def freeze_datetime(monkeypatch):
+    """Return a helper that pins ``module.datetime.now()`` to a fixed time."""
+
+    def freeze(module, now: datetime) -> None:
+        class _FrozenDatetime(datetime):
+            """datetime subclass whose now() always returns the pinned time."""
+
+            @classmethod
+            def now(cls, tz=None):
+                return now
+
+        monkeypatch.setattr(module, "datetime", _FrozenDatetime)
+
+    return freeze
+
+
+@pytest.fixture(scope="session")
+def sample_rss_feed():
+    """Fixture providing sample RSS feed data, read once per session."""
+    return (
+        importlib.resources.files("tests.data")
+        .joinpath("sample_feed.xml")
+        .read_text(encoding="utf-8")
+    )
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_feed(sample_rss_feed):
+    """Fixture providing the sample RSS feed parsed once per session."""
+    return feedparser.parse(sample_rss_feed)
+
+
 @pytest.fixture
 def mock_llm_evaluator():
     """Create a mock LLM evaluator for testing."""
@@ -279,13 +326,26 @@ def mock_env_vars():
 
 
 # Async fixtures
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_loop():
-    """Create an event loop for async tests."""
+    """Share one stock asyncio event loop across the async tests of a module.
+
+    Module scope lets class- and module-scoped async fixtures reuse the loop.
+    When looptime is installed the loop is patched with time compaction off,
+    so a test can fast-forward its own awaits with ``looptime.enabled()``.
+    It stays a stock loop even where uvloop is installed, because looptime
+    can only patch ``asyncio.BaseEventLoop`` subclasses.
+    The default executor is shut down before closing so executor threads
+    started by components don't outlive the module.
+    """
     import asyncio
 
     loop = asyncio.new_event_loop()
+    if looptime is not None:
+        # The same disabled-by-default patch looptime's own plugin applies
+        loop = looptime.patch_event_loop(loop, _enabled=False)
     yield loop
+    loop.run_until_complete(loop.shutdown_default_executor())
     loop.close()
 
 
@@ -295,6 +355,10 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: mark test as slow running")
     config.addinivalue_line("markers", "integration: mark test as integration test")
     config.addinivalue_line("markers", "unit: mark test as unit test")
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests on one pytest-xdist worker with --dist loadgroup",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -0,0 +1,3 @@
+"""
+Static data files used by the test suite.
+"""
@@ -0,0 +1,230 @@
+"""
+Unit tests for the RSS DealDetector component.
+"""
+
+import json
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ozb_deal_filter.components.rss_monitor import DealDetector, _deal_key
+
+# Minimal stand-in for feedparser's category objects, which expose ``term``
+Category = namedtuple("Category", "term")
+
+# Publish date inside DealDetector's default max_age_hours window
+RECENT = datetime.now().isoformat()
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    """Seen-deal state path under tmp_path, keeping logs/ untouched."""
+    return str(tmp_path / "seen_deals.json")
+
+
+class TestDealDetector:
+    """Test cases for DealDetector class."""
+
+    def test_init(self, state_file):
+        """Test DealDetector initialization."""
+        detector = DealDetector(state_file=state_file)
+
+        assert len(detector.seen_deal_ids) == 0
+
+    def test_load_state_migrates_legacy_links(self, tmp_path):
+        """Test that link-based state files are converted to integer keys."""
+        state_file = tmp_path / "seen_deals.json"
+        state_file.write_text(json.dumps({"seen_deals": ["https://example.com/deal1"]}))
+
+        detector = DealDetector(state_file=str(state_file))
+
+        assert detector.seen_deal_ids == {_deal_key("https://example.com/deal1")}
+
+    @patch("feedparser.parse")
+    def test_migrated_links_are_deduplicated(self, mock_parse, tmp_path):
+        """Test that a deal seen before migration is not reported again."""
+        state_file = tmp_path / "seen_deals.json"
+        state_file.write_text(json.dumps({"seen_deals": ["https://example.com/deal1"]}))
+        mock_feed = Mock()
+        mock_feed.bozo = False
+        mock_feed.entries = [
+            {
+                "title": title,
+                "description": "Amazing discount",
+                "link": link,
+                "published": RECENT,
+            }
+            for title, link in (
+                ("Seen Deal", "https://example.com/deal1"),
+                ("New Deal", "https://example.com/deal2"),
+            )
+        ]
+        mock_parse.return_value = mock_feed
+
+        detector = DealDetector(state_file=str(state_file))
+        deals = detector.detect_new_deals("<rss>test feed</rss>")
+
+        assert [deal.link for deal in deals] == ["https://example.com/deal2"]
+
+    def test_mixed_state_round_trips(self, tmp_path):
+        """Test that a mixed legacy/new state file survives save and load."""
+        state_file = tmp_path / "seen_deals.json"
+        new_key = _deal_key("https://example.com/deal2")
+        state_file.write_text(
+            json.dumps({"seen_deals": ["https://example.com/deal1", new_key]})
+        )
+        expected = {_deal_key("https://example.com/deal1"), new_key}
+
+        detector = DealDetector(state_file=str(state_file))
+        assert detector.seen_deal_ids == expected
+
+        detector._save_state()
+        saved = json.loads(state_file.read_text())["seen_deals"]
+        assert sorted(saved) == sorted(expected)
+
+        assert DealDetector(state_file=str(state_file)).seen_deal_ids == expected
+
+    @patch("feedparser.parse")
+    def test_detect_new_deals_valid_feed(self, mock_parse, state_file):
+        """Test detecting new deals from valid RSS feed."""
+        # Mock feedparser response
+        mock_feed = Mock()
+        mock_feed.bozo = False
+        mock_feed.entries = [
+            {
+                "title": "Great Deal on Electronics",
+                "description": "Amazing discount on electronics",
+                "link": "https://example.com/deal1",
+                "published": RECENT,
+                "category": "Electronics",
+            },
+            {
+                "title": "Another Deal",
+                "description": "Another great deal",
+                "link": "https://example.com/deal2",
+                "published": RECENT,
+            },
+        ]
+        mock_parse.return_value = mock_feed
+
+        detector = DealDetector(state_file=state_file)
+        deals = detector.detect_new_deals("<rss>test feed</rss>")
+
+        assert len(deals) == 2
+        assert deals[0].title == "Great Deal on Electronics"
+        assert deals[0].link == "https://example.com/deal1"
+        assert deals[1].title == "Another Deal"
+        assert detector.seen_deal_ids == {
+            _deal_key("https://example.com/deal1"),
+            _deal_key("https://example.com/deal2"),
+        }
+
+    @patch("feedparser.parse")
+    def test_detect_new_deals_duplicate_deals(self, mock_parse, state_file):
+        """Test detecting deals with duplicates."""
+        # Mock feedparser response
+        mock_feed = Mock()
+        mock_feed.bozo = False
+        mock_feed.entries = [
+            {
+                "title": "Great Deal",
+                "description": "Amazing discount",
+                "link": "https://example.com/deal1",
+                "published": RECENT,
+            }
+        ]
+        mock_parse.return_value = mock_feed
+
+        detector = DealDetector(state_file=state_file)
+
+        # First detection
+        deals1 = detector.detect_new_deals("<rss>test feed</rss>")
+        assert len(deals1) == 1
+
+        # Second detection with same deal
+        deals2 = detector.detect_new_deals("<rss>test feed</rss>")
+        assert len(deals2) == 0  # Should be filtered out as duplicate
+
+    @patch("feedparser.parse")
+    def test_detect_new_deals_invalid_entry(self, mock_parse, state_file):
+        """Test detecting deals with invalid entry."""
+        # Mock feedparser response with invalid entry
+        mock_feed = Mock()
+        mock_feed.bozo = False
+        mock_feed.entries = [
+            {
+                "title": "",  # Invalid: empty title
+                "description": "Amazing discount",
+                "link": "https://example.com/deal1",
+                "published": RECENT,
+            },
+            {
+                "title": "Valid Deal",
+                "description": "Valid description",
+                "link": "https://example.com/deal2",
+                "published": RECENT,
+            },
+        ]
+        mock_parse.return_value = mock_feed
+
+        detector = DealDetector(state_file=state_file)
+        deals = detector.detect_new_deals("<rss>test feed</rss>")
+
+        # Should only get the valid deal
+        assert len(deals) == 1
+        assert deals[0].title == "Valid Deal"
+
+    @patch("feedparser.parse")
+    def test_detect_new_deals_bozo_feed(self, mock_parse, state_file):
+        """Test detecting deals from malformed RSS feed."""
+        # Mock feedparser response with bozo flag
+        mock_feed = Mock()
+        mock_feed.bozo = True
+        mock_feed.entries = [
+            {
+                "title": "Deal from Bozo Feed",
+                "description": "Description",
+                "link": "https://example.com/deal1",
+                "published": RECENT,
+            }
+        ]
+        mock_parse.return_value = mock_feed
+
+        detector = DealDetector(state_file=state_file)
+        deals = detector.detect_new_deals("<rss>malformed feed</rss>")
+
+        # Should still process deals despite bozo flag
+        assert len(deals) == 1
+        assert deals[0].title == "Deal from Bozo Feed"
+
+    @patch("feedparser.parse")
+    def test_detect_new_deals_parse_error(self, mock_parse, state_file):
+        """Test detecting deals with parsing error."""
+        mock_parse.side_effect = Exception("Parse error")
+
+        detector = DealDetector(state_file=state_file)
+        deals = detector.detect_new_deals("<rss>invalid feed</rss>")
+
+        assert len(deals) == 0
+
+    @pytest.fixture(scope="class")
+    def detector(self, tmp_path_factory):
+        """Shared detector; ``_extract_category`` does not touch instance state."""
+        state_dir = tmp_path_factory.mktemp("state")
+        return DealDetector(state_file=str(state_dir / "seen_deals.json"))
+
+    @pytest.mark.parametrize(
+        "entry,expected",
+        [
+            ({"category": "Electronics"}, "Electronics"),
+            ({"category": [Category(term="Computing")]}, "Computing"),
+            ({"category": ["Gaming"]}, "Gaming"),
+            ({"title": "Deal without category"}, None),
+        ],
+        ids=["string", "list_with_term", "list_with_string", "none"],
+    )
+    def test_extract_category(self, detector, entry, expected):
+        """Test category extraction across the supported entry shapes."""
+        assert detector._extract_category(entry) == expected
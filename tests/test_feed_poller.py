@@ -0,0 +1,215 @@
+"""
+Unit tests for the RSS FeedPoller component.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from ozb_deal_filter.components import rss_monitor
+from ozb_deal_filter.components.rss_monitor import FeedPoller
+
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Shared exception instances for error-path tests; tests only raise them
+_TIMEOUT_EXC = requests.exceptions.Timeout()
+_CONNECTION_EXC = requests.exceptions.ConnectionError()
+_HTTP_404_EXC = requests.exceptions.HTTPError(response=Mock(status_code=404))
+
+
+class TestFeedPoller:
+    """Test cases for FeedPoller class."""
+
+    @pytest.fixture(autouse=True)
+    def frozen_now(self, freeze_datetime):
+        """Freeze the clock seen by rss_monitor for deterministic timing."""
+        freeze_datetime(rss_monitor, FROZEN_NOW)
+        return FROZEN_NOW
+
+    def test_init(self):
+        """Test FeedPoller initialization."""
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+
+        assert poller.feed_url == "https://example.com/feed.xml"
+        assert poller.polling_interval == 120
+        assert poller.timeout == 30
+        assert poller.max_retries == 3
+        assert poller.last_poll_time is None
+        assert poller.last_feed_hash is None
+        assert poller.consecutive_failures == 0
+        assert not poller.is_active
+
+    def test_init_with_custom_params(self):
+        """Test FeedPoller initialization with custom parameters."""
+        poller = FeedPoller(
+            "https://example.com/feed.xml",
+            polling_interval=60,
+            timeout=15,
+            max_retries=5,
+        )
+
+        assert poller.polling_interval == 60
+        assert poller.timeout == 15
+        assert poller.max_retries == 5
+
+    def test_fetch_feed_success(self, mock_session_get, frozen_now):
+        """Test successful feed fetching."""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.text = "<rss>test content</rss>"
+        mock_session_get.return_value = mock_response
+
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+        result = poller.fetch_feed()
+
+        assert result == "<rss>test content</rss>"
+        assert poller.consecutive_failures == 0
+        assert poller.last_poll_time == frozen_now
+        mock_session_get.assert_called_once()
+
+    def test_fetch_feed_not_modified(self, mock_session_get, frozen_now):
+        """Test conditional fetch when the server reports no changes."""
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_response.text = ""
+        mock_session_get.return_value = mock_response
+
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+        poller.last_etag = '"abc"'
+        result = poller.fetch_feed()
+
+        assert result is None
+        assert poller.consecutive_failures == 0
+        assert poller.last_poll_time == frozen_now
+        sent_headers = mock_session_get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"abc"'
+        mock_response.raise_for_status.assert_not_called()
+
+    def test_fetch_feed_conditional_get_round_trip(self, mock_session_get):
+        """Test that validators from a 200 are sent on the next request."""
+        modified = Mock(
+            status_code=200,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"},
+            text="<rss>test content</rss>",
+        )
+        not_modified = Mock(status_code=304, headers={}, text="")
+        mock_session_get.side_effect = [modified, not_modified]
+
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+
+        assert poller.fetch_feed() == "<rss>test content</rss>"
+        assert mock_session_get.call_args.kwargs["headers"] == {}
+        assert poller.last_etag == '"v1"'
+        assert poller.last_modified == "Mon, 01 Jan 2024 12:00:00 GMT"
+
+        assert poller.fetch_feed() is None
+        assert mock_session_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT",
+        }
+
+    @pytest.mark.parametrize(
+        "exc", [_TIMEOUT_EXC, _CONNECTION_EXC], ids=["timeout", "connection_error"]
+    )
+    def test_fetch_feed_network_error(self, mock_session_get, exc):
+        """Test feed fetching with timeout and connection errors."""
+        mock_session_get.side_effect = exc
+
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+        result = poller.fetch_feed()
+
+        assert result is None
+        assert poller.consecutive_failures == 1
+
+    def test_fetch_feed_http_error(self, mock_session_get):
+        """Test feed fetching with HTTP error."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = _HTTP_404_EXC
+        mock_session_get.return_value = mock_response
+
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+        result = poller.fetch_feed()
+
+        assert result is None
+        assert poller.consecutive_failures == 1
+
+    def test_has_feed_changed_first_time(self):
+        """Test feed change detection on first poll."""
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+
+        result = poller.has_feed_changed("test content")
+
+        assert result is True
+        assert poller.last_feed_hash is not None
+
+    def test_has_feed_changed_same_content(self):
+        """Test feed change detection with same content."""
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+
+        # First call
+        poller.has_feed_changed("test content")
+
+        # Second call with same content
+        result = poller.has_feed_changed("test content")
+
+        assert result is False
+
+    def test_has_feed_changed_different_content(self):
+        """Test feed change detection with different content."""
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+
+        # First call
+        poller.has_feed_changed("test content")
+
+        # Second call with different content
+        result = poller.has_feed_changed("different content")
+
+        assert result is True
+
+    def test_should_poll_first_time(self):
+        """Test polling decision on first poll."""
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+
+        assert poller.should_poll() is True
+
+    def test_should_poll_too_soon(self, frozen_now):
+        """Test polling decision when too soon."""
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+        poller.last_poll_time = frozen_now
+
+        assert poller.should_poll() is False
+
+    def test_should_poll_time_elapsed(self, frozen_now):
+        """Test polling decision when enough time has elapsed."""
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+        poller.last_poll_time = frozen_now - timedelta(seconds=130)
+
+        assert poller.should_poll() is True
+
+    def test_is_healthy_no_failures(self):
+        """Test health check with no failures."""
+        poller = FeedPoller(
+            "https://example.com/feed.xml", polling_interval=120, max_retries=3
+        )
+
+        assert poller.is_healthy() is True
+
+    def test_is_healthy_some_failures(self):
+        """Test health check with some failures."""
+        poller = FeedPoller(
+            "https://example.com/feed.xml", polling_interval=120, max_retries=3
+        )
+        poller.consecutive_failures = 3
+
+        assert poller.is_healthy() is True
+
+    def test_is_healthy_too_many_failures(self):
+        """Test health check with too many failures."""
+        poller = FeedPoller(
+            "https://example.com/feed.xml", polling_interval=120, max_retries=3
+        )
+        poller.consecutive_failures = 7  # More than max_retries * 2
+
+        assert poller.is_healthy() is False
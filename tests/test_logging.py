@@ -110,6 +110,19 @@ class TestLoggingManager:
             # Verify that rotating file handlers were created
             assert mock_handler.call_count >= 2  # Main log and error log
 
+    @patch("logging.handlers.RotatingFileHandler")
+    def test_repeated_setup_replaces_component_handlers(self, mock_handler):
+        """Test that setting up logging again does not stack component handlers."""
+        # Distinct handlers per call, since addHandler ignores duplicates
+        mock_handler.side_effect = lambda *args, **kwargs: Mock(level=logging.INFO)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            LoggingManager(log_dir=temp_dir)
+            LoggingManager(log_dir=temp_dir)
+
+            component_logger = logging.getLogger("ozb_deal_filter.orchestrator")
+            assert len(component_logger.handlers) == 1
+
     @patch("logging.handlers.RotatingFileHandler")
     def test_get_component_logger(self, mock_handler):
         """Test getting component loggers."""
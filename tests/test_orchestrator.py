@@ -3,6 +3,7 @@ Tests for the application orchestrator.
 """
 
 import asyncio
+import signal
 import tempfile
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
@@ -420,6 +421,118 @@ class TestApplicationOrchestrator:
             assert orchestrator._shutdown_event.is_set()
             mock_rss_monitor.stop_monitoring.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_shutdown_releases_resources_last(self, config_file):
+        """Test that a second shutdown() waits for the one stopping components."""
+        with patch("ozb_deal_filter.orchestrator.ConfigurationManager"):
+            orchestrator = ApplicationOrchestrator(config_file)
+            orchestrator._running = True
+
+            polling_may_stop = asyncio.Event()
+            mock_bot_handler = Mock()
+            mock_bot_handler.stop_polling = AsyncMock(side_effect=polling_may_stop.wait)
+            orchestrator._telegram_bot_handler = mock_bot_handler
+            mock_processor = Mock()
+            mock_processor.close = AsyncMock()
+            orchestrator._feed_command_processor = mock_processor
+
+            first = asyncio.create_task(orchestrator.shutdown())
+            second = asyncio.create_task(orchestrator.shutdown())
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            # The second caller must not release resources mid-shutdown
+            assert not second.done()
+            mock_processor.close.assert_not_awaited()
+            orchestrator._executor.submit(lambda: None).result()
+
+            polling_may_stop.set()
+            await asyncio.gather(first, second)
+
+            mock_bot_handler.stop_polling.assert_awaited_once()
+            assert mock_processor.close.await_count == 2
+            with pytest.raises(RuntimeError):
+                orchestrator._executor.submit(lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_signal_shutdown_completes_before_run_returns(self, config_file):
+        """Test that run() waits for a signal-triggered shutdown to finish."""
+        events = []
+
+        async def stop_polling():
+            events.append("stop_polling start")
+            await asyncio.sleep(0.01)
+            events.append("stop_polling done")
+
+        with patch("ozb_deal_filter.orchestrator.ConfigurationManager"):
+            orchestrator = ApplicationOrchestrator(config_file)
+            orchestrator._config_manager = Mock()
+            orchestrator._config_manager.reload_if_changed.return_value = False
+
+            mock_rss_monitor = Mock()
+            mock_rss_monitor.start_monitoring = AsyncMock(
+                side_effect=lambda: orchestrator._signal_handler(signal.SIGTERM, None)
+            )
+            mock_rss_monitor.stop_monitoring = AsyncMock(
+                side_effect=lambda: events.append("rss stopped")
+            )
+            orchestrator._rss_monitor = mock_rss_monitor
+            orchestrator._telegram_bot_handler = Mock(stop_polling=stop_polling)
+
+            with patch.object(
+                orchestrator, "initialize", AsyncMock(return_value=True)
+            ), patch.object(orchestrator, "_health_check", AsyncMock()):
+                await orchestrator.run()
+            events.append("run returned")
+
+        assert events == [
+            "stop_polling start",
+            "stop_polling done",
+            "rss stopped",
+            "run returned",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_context_manager_releases_executor(self, config_file):
+        """Test that leaving the context releases worker threads without start()."""
+        with patch("ozb_deal_filter.orchestrator.ConfigurationManager"):
+            async with ApplicationOrchestrator(config_file) as orchestrator:
+                assert orchestrator._running is False
+
+            with pytest.raises(RuntimeError):
+                orchestrator._executor.submit(lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_run_releases_executor_when_initialization_fails(self, config_file):
+        """Test that run() releases worker threads when it never starts."""
+        with patch("ozb_deal_filter.orchestrator.ConfigurationManager"):
+            orchestrator = ApplicationOrchestrator(config_file)
+
+            with patch.object(
+                orchestrator, "initialize", AsyncMock(return_value=False)
+            ):
+                await orchestrator.run()
+
+            with pytest.raises(RuntimeError):
+                orchestrator._executor.submit(lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_run_closes_feed_processor_when_validation_fails(self, config_file):
+        """Test that run() closes an opened feed processor session on early exit."""
+        with patch("ozb_deal_filter.orchestrator.ConfigurationManager"):
+            orchestrator = ApplicationOrchestrator(config_file)
+            mock_processor = Mock()
+            mock_processor.close = AsyncMock()
+
+            async def open_then_fail_validation():
+                orchestrator._feed_command_processor = mock_processor
+                return False
+
+            with patch.object(orchestrator, "initialize", open_then_fail_validation):
+                await orchestrator.run()
+
+            mock_processor.close.assert_awaited_once()
+
     def test_increment_error_count(self, config_file):
         """Test error count tracking."""
         with patch("ozb_deal_filter.orchestrator.ConfigurationManager"):
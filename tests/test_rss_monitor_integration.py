@@ -0,0 +1,65 @@
+"""
+Integration tests for RSS monitoring components.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import feedparser
+
+from ozb_deal_filter.components.rss_monitor import DealDetector, FeedPoller
+
+
+class TestIntegration:
+    """Integration tests for RSS monitoring components."""
+
+    def test_full_workflow_integration(
+        self,
+        mock_session_get,
+        sample_rss_feed,
+        parsed_sample_feed,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Test full workflow from RSS fetch to deal detection."""
+        # Reuse one parse tree for both detection passes. The sample entries
+        # are re-dated to now so they fall inside max_age_hours; the cached
+        # session tree itself is left untouched.
+        recent = datetime.now().isoformat()
+        feed = feedparser.FeedParserDict(parsed_sample_feed)
+        feed["entries"] = [
+            feedparser.FeedParserDict(entry, published=recent)
+            for entry in parsed_sample_feed.entries
+        ]
+        monkeypatch.setattr(feedparser, "parse", lambda _: feed)
+
+        # Mock HTTP response
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.text = sample_rss_feed
+        mock_session_get.return_value = mock_response
+
+        # Create components
+        poller = FeedPoller("https://example.com/feed.xml", polling_interval=120)
+        detector = DealDetector(state_file=str(tmp_path / "seen_deals.json"))
+
+        # Fetch feed
+        feed_content = poller.fetch_feed()
+        assert feed_content is not None
+
+        # Check if changed (first time should be True)
+        changed = poller.has_feed_changed(feed_content)
+        assert changed is True
+
+        # Detect deals
+        deals = detector.detect_new_deals(feed_content)
+        assert len(deals) == 2
+        assert deals[0].title == "50% off Electronics at TechStore"
+        assert deals[1].title == "Gaming Laptop $999 (was $1999)"
+
+        # Same content again should show no changes
+        changed2 = poller.has_feed_changed(feed_content)
+        assert changed2 is False
+
+        # Should detect no new deals
+        deals2 = detector.detect_new_deals(feed_content)
+        assert deals2 == []  # All deals already seen
@@ -3,817 +3,762 @@ System validation and monitoring tests.
 
 This module provides tests for health check endpoints, metrics collection,
 alert delivery validation, and system startup validation.
+
+The health, metrics and delivery classes are each their own xdist group, so
+they run in parallel with ``pytest -n auto --dist loadgroup`` while each keeps
+its shared fixtures on a single worker. The startup tests build a fresh
+orchestrator per test and are left ungrouped so they spread across workers.
 """
 
 import asyncio
-import tempfile
 import time
+from contextlib import ExitStack
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Iterator, List
+from unittest.mock import AsyncMock, Mock, create_autospec, patch
 
 import pytest
+import pytest_asyncio
 import yaml
 
+from ozb_deal_filter import orchestrator as orchestrator_module
+from ozb_deal_filter.components.llm_evaluator import LLMEvaluator
+from ozb_deal_filter.components.rss_monitor import RSSMonitor
+from ozb_deal_filter.interfaces import IMessageDispatcher
 from ozb_deal_filter.models.alert import FormattedAlert
+from ozb_deal_filter.models.config import Configuration
 from ozb_deal_filter.models.deal import Deal, RawDeal
 from ozb_deal_filter.models.delivery import DeliveryResult
 from ozb_deal_filter.models.evaluation import EvaluationResult
 from ozb_deal_filter.models.filter import FilterResult, UrgencyLevel
 from ozb_deal_filter.orchestrator import ApplicationOrchestrator
+from ozb_deal_filter.services.evaluation_service import EvaluationService
+
+# Template for the laptop deals fed through the pipeline. Deals are
+# handed straight to _process_single_deal, so no RSS fetch or parse is needed.
+_LAPTOP_DEAL = RawDeal(
+    title="Test Laptop Deal",
+    description="Great laptop deal",
+    link="https://example.com/deal",
+    pub_date="Mon, 01 Jan 2024 12:00:00 GMT",
+    category="Electronics",
+)
+
+# Patch the names where they are looked up; both modules import them directly
+_LLM_EVALUATOR_TARGET = "ozb_deal_filter.orchestrator.LLMEvaluator"
+_SERVICE_LLM_EVALUATOR_TARGET = (
+    "ozb_deal_filter.services.evaluation_service.LLMEvaluator"
+)
+_DISPATCHER_FACTORY_TARGET = "ozb_deal_filter.orchestrator.MessageDispatcherFactory"
+
+_BASE_CONFIG: Dict[str, Any] = {
+    "rss_feeds": ["https://www.ozbargain.com.au/deals/feed"],
+    "user_criteria": {
+        "prompt_template": "prompts/deal_evaluator.example.txt",
+        "max_price": 500.0,
+        "min_discount_percentage": 20.0,
+        "categories": ["Electronics"],
+        "keywords": ["laptop", "phone"],
+        "min_authenticity_score": 0.6,
+    },
+    "llm_provider": {
+        "type": "local",
+        "local": {"model": "llama2", "docker_image": "ollama/ollama"},
+    },
+    "messaging_platform": {
+        "type": "telegram",
+        "telegram": {"bot_token": "test_token", "chat_id": "test_chat"},
+    },
+    "system": {
+        "polling_interval": 60,
+        "max_concurrent_feeds": 5,
+        "alert_timeout": 300,
+        "urgent_alert_timeout": 120,
+    },
+}
+
+# Test deals carry no votes, so they score the neutral 0.5 authenticity
+_LAPTOP_ONLY_CONFIG: Dict[str, Any] = {
+    **_BASE_CONFIG,
+    "user_criteria": {
+        **_BASE_CONFIG["user_criteria"],
+        "keywords": ["laptop"],
+        "min_authenticity_score": 0.5,
+    },
+}
+
+# Per-class configurations, picked by each class's ``config_variant``;
+# shared read-only, never mutated by tests
+_CONFIG_VARIANTS: Dict[str, Dict[str, Any]] = {
+    "health": _BASE_CONFIG,
+    "metrics": _LAPTOP_ONLY_CONFIG,
+    "delivery": _LAPTOP_ONLY_CONFIG,
+    "startup": {
+        **_BASE_CONFIG,
+        "rss_feeds": [
+            "https://www.ozbargain.com.au/deals/feed",
+            "https://www.ozbargain.com.au/cat/computing/feed",
+        ],
+        "user_criteria": {
+            **_BASE_CONFIG["user_criteria"],
+            "categories": ["Electronics", "Computing"],
+        },
+    },
+}
+
+# Fixed timestamps so mocked deliveries and uptime checks never read the clock
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+_FROZEN_LOCAL_NOW = datetime(2024, 1, 1, 12, 30)
+
+# Canned mock results; shared read-only across tests
+_RELEVANT_EVAL = EvaluationResult(
+    is_relevant=True,
+    confidence_score=0.8,
+    reasoning="Test evaluation",
+)
+_SUCCESS_DELIVERY = DeliveryResult(
+    success=True,
+    delivery_time=_FIXED_NOW,
+    error_message=None,
+)
+
+# Status fields and component health entries every started system reports
+_REQUIRED_STATUS_FIELDS = frozenset(
+    {
+        "running",
+        "startup_time",
+        "uptime",
+        "component_health",
+        "error_counts",
+        "config_loaded",
+    }
+)
+_EXPECTED_COMPONENTS = frozenset(
+    {
+        "config_manager",
+        "rss_monitor",
+        "deal_parser",
+        "llm_evaluator",
+        "evaluation_service",
+        "alert_formatter",
+        "message_dispatcher",
+    }
+)
+
+
+class _FakeClock:
+    """Deterministic clock that advances by ``step`` seconds per reading."""
+
+    def __init__(self, step: float):
+        self.step = step
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        reading = self.now
+        self.now += self.step
+        return reading
+
+
+@pytest.fixture(scope="module", autouse=True)
+def component_patches() -> Iterator[SimpleNamespace]:
+    """Patch the LLM evaluator and dispatcher factory once for the module."""
+    with ExitStack() as stack:
+        llm_class = stack.enter_context(patch(_LLM_EVALUATOR_TARGET, autospec=True))
+        # The evaluation service builds its own evaluator from the same mock class
+        stack.enter_context(patch(_SERVICE_LLM_EVALUATOR_TARGET, new=llm_class))
+        yield SimpleNamespace(
+            llm_class=llm_class,
+            dispatcher_factory=stack.enter_context(
+                patch(_DISPATCHER_FACTORY_TARGET, autospec=True)
+            ),
+        )
+
+
+def _wire_component_mocks(patches: SimpleNamespace) -> SimpleNamespace:
+    """Reset the module patches and give them fresh LLM and dispatcher mocks.
+
+    Return values and side effects are cleared too, so nothing a test
+    configures on the shared patches carries over to the next test.
+    """
+    patches.llm_class.reset_mock(return_value=True, side_effect=True)
+    patches.dispatcher_factory.reset_mock(return_value=True, side_effect=True)
+
+    mock_llm = create_autospec(LLMEvaluator, instance=True)
+    mock_llm.evaluate_deal.return_value = _RELEVANT_EVAL
+    patches.llm_class.return_value = mock_llm
+
+    mock_dispatcher = Mock(spec=IMessageDispatcher)
+    mock_dispatcher.test_connection = Mock(
+        spec=IMessageDispatcher.test_connection, return_value=True
+    )
+    patches.dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
+
+    return SimpleNamespace(
+        llm_class=patches.llm_class,
+        llm=mock_llm,
+        dispatcher_factory=patches.dispatcher_factory,
+        dispatcher=mock_dispatcher,
+    )
+
+
+@pytest.fixture(autouse=True)
+def mocked_components(component_patches):
+    """Mocked LLM evaluator and message dispatcher, rewired for every test."""
+    return _wire_component_mocks(component_patches)
+
+
+@pytest.fixture(scope="class")
+def config_file(request, tmp_path_factory) -> str:
+    """Write the ``_CONFIG_VARIANTS`` entry named by the class's ``config_variant``."""
+    variant = request.cls.config_variant
+    path = tmp_path_factory.mktemp("config") / f"{variant}.yaml"
+    path.write_text(yaml.safe_dump(_CONFIG_VARIANTS[variant], sort_keys=True))
+    return str(path)
+
+
+@pytest_asyncio.fixture
+async def orchestrator(
+    config_file, mocked_components
+) -> AsyncIterator[ApplicationOrchestrator]:
+    """Uninitialized orchestrator that is always shut down after the test."""
+    async with ApplicationOrchestrator(config_file) as orchestrator:
+        yield orchestrator
+
+
+@pytest_asyncio.fixture
+async def initialized_orchestrator(orchestrator) -> ApplicationOrchestrator:
+    """The ``orchestrator`` fixture after initialize() has run."""
+    await orchestrator.initialize()
+    return orchestrator
+
+
+@pytest.fixture
+def bare_orchestrator() -> Iterator[ApplicationOrchestrator]:
+    """Orchestrator built by __init__ alone; no configuration or components loaded."""
+    orchestrator = ApplicationOrchestrator()
+    yield orchestrator
+    orchestrator._executor.shutdown(wait=True)
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="system_validation_health")
 class TestHealthCheckEndpoints:
     """Test system health check functionality."""
 
-    @pytest.fixture
-    def health_check_config(self):
-        """Create configuration for health check testing."""
-        return {
-            "rss_feeds": ["https://www.ozbargain.com.au/deals/feed"],
-            "user_criteria": {
-                "prompt_template": "prompts/deal_evaluator.example.txt",
-                "max_price": 500.0,
-                "min_discount_percentage": 20.0,
-                "categories": ["Electronics"],
-                "keywords": ["laptop", "phone"],
-                "min_authenticity_score": 0.6,
-            },
-            "llm_provider": {
-                "type": "local",
-                "local": {"model": "llama2", "docker_image": "ollama/ollama"},
-            },
-            "messaging_platform": {
-                "type": "telegram",
-                "telegram": {"bot_token": "test_token", "chat_id": "test_chat"},
-            },
-            "system": {
-                "polling_interval": 60,
-                "max_concurrent_feeds": 5,
-                "alert_timeout": 300,
-                "urgent_alert_timeout": 120,
-            },
-        }
+    config_variant = "health"
 
-    @pytest.fixture
-    def config_file_health(self, health_check_config):
-        """Create config file for health check tests."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(health_check_config, f)
-            return f.name
-
-    @pytest.mark.asyncio
-    async def test_system_health_check_all_healthy(self, config_file_health):
-        """Test health check when all components are healthy."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock healthy components
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(
-                return_value=EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
-            )
-
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            # Create and initialize orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_health)
+    @pytest_asyncio.fixture(scope="class")
+    async def shared_orchestrator(self, config_file, component_patches):
+        """Initialize one orchestrator with mocked LLM and dispatcher per class."""
+        mocks = _wire_component_mocks(component_patches)
+        async with ApplicationOrchestrator(config_file) as orchestrator:
             await orchestrator.initialize()
+            # Report the monitor as running without starting its polling loop
+            orchestrator._rss_monitor.is_monitoring = True
+            yield SimpleNamespace(
+                orchestrator=orchestrator,
+                llm=mocks.llm,
+                dispatcher=mocks.dispatcher,
+                initial_health=orchestrator._component_health.copy(),
+            )
 
-            # Perform health check
-            await orchestrator._health_check()
+    @pytest.fixture
+    def health(self, shared_orchestrator):
+        """Reset the shared orchestrator's mutable state before each test."""
+        shared = shared_orchestrator
+        shared.orchestrator._component_health = shared.initial_health.copy()
+        shared.orchestrator._error_counts = {}
+        shared.orchestrator._last_health_check = None
+        shared.llm.evaluate_deal = AsyncMock(
+            spec=LLMEvaluator.evaluate_deal,
+            return_value=_RELEVANT_EVAL,
+        )
+        shared.dispatcher.test_connection = Mock(
+            spec=IMessageDispatcher.test_connection, return_value=True
+        )
+        return shared
+
+    async def test_system_health_check_all_healthy(self, health):
+        """Test health check when all components are healthy."""
+        orchestrator = health.orchestrator
 
-            # Get system status
-            status = orchestrator.get_system_status()
+        # Perform health check
+        await orchestrator._health_check()
 
-            # Verify health status
-            assert status["running"] is False  # Not started yet
-            assert status["config_loaded"] is True
-            assert status["component_health"]["config_manager"] is True
-            assert status["component_health"]["rss_monitor"] is True
-            assert status["component_health"]["deal_parser"] is True
-            assert status["component_health"]["llm_evaluator"] is True
-            assert status["component_health"]["message_dispatcher"] is True
+        # Get system status
+        status = orchestrator.get_system_status()
 
-            await orchestrator.shutdown()
+        # Verify health status
+        assert status["running"] is False  # Not started yet
+        assert status["config_loaded"] is True
+        assert status["component_health"]["config_manager"] is True
+        assert status["component_health"]["rss_monitor"] is True
+        assert status["component_health"]["deal_parser"] is True
+        assert status["component_health"]["llm_evaluator"] is True
+        assert status["component_health"]["message_dispatcher"] is True
 
-    @pytest.mark.asyncio
-    async def test_system_health_check_with_failures(self, config_file_health):
+    async def test_system_health_check_with_failures(self, health):
         """Test health check when some components are unhealthy."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock LLM failure
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(side_effect=Exception("LLM unavailable"))
-
-            # Mock message dispatcher failure
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = False
-
-            # Create and initialize orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_health)
-            await orchestrator.initialize()
+        orchestrator = health.orchestrator
 
-            # Simulate component failures
-            orchestrator._component_health["llm_evaluator"] = False
-            orchestrator._component_health["message_dispatcher"] = False
+        # Mock LLM and message dispatcher failures
+        health.llm.evaluate_deal.side_effect = Exception("LLM unavailable")
+        health.dispatcher.test_connection.return_value = False
 
-            # Perform health check
-            await orchestrator._health_check()
+        # Simulate component failures
+        orchestrator._component_health["llm_evaluator"] = False
+        orchestrator._component_health["message_dispatcher"] = False
 
-            # Get system status
-            status = orchestrator.get_system_status()
+        # Perform health check
+        await orchestrator._health_check()
 
-            # Verify health status reflects failures
-            assert status["component_health"]["llm_evaluator"] is False
-            assert status["component_health"]["message_dispatcher"] is False
+        # Get system status
+        status = orchestrator.get_system_status()
 
-            # Critical components should still be healthy
-            assert status["component_health"]["config_manager"] is True
-            assert status["component_health"]["rss_monitor"] is True
-            assert status["component_health"]["deal_parser"] is True
+        # Verify health status reflects failures
+        assert status["component_health"]["llm_evaluator"] is False
+        assert status["component_health"]["message_dispatcher"] is False
 
-            await orchestrator.shutdown()
+        # Critical components should still be healthy
+        assert status["component_health"]["config_manager"] is True
+        assert status["component_health"]["rss_monitor"] is True
+        assert status["component_health"]["deal_parser"] is True
 
-    @pytest.mark.asyncio
-    async def test_health_check_recovery(self, config_file_health):
+    async def test_health_check_recovery(self, health):
         """Test health check recovery after component failure."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock dispatcher that initially fails then recovers
-            connection_attempts = 0
-
-            def mock_test_connection():
-                nonlocal connection_attempts
-                connection_attempts += 1
-                return connection_attempts > 2  # Fail first 2 attempts
-
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(
-                return_value=EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
-            )
-
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection = mock_test_connection
+        orchestrator = health.orchestrator
 
-            # Create and initialize orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_health)
-            await orchestrator.initialize()
+        # Mock dispatcher that fails twice, then recovers
+        health.dispatcher.test_connection.side_effect = [False, False, True]
 
-            # First health check - should fail
-            await orchestrator._health_check()
-            status1 = orchestrator.get_system_status()
-            assert status1["component_health"]["message_dispatcher"] is False
-
-            # Second health check - should still fail
-            await orchestrator._health_check()
-            status2 = orchestrator.get_system_status()
-            assert status2["component_health"]["message_dispatcher"] is False
-
-            # Third health check - should recover
-            await orchestrator._health_check()
-            status3 = orchestrator.get_system_status()
-            assert status3["component_health"]["message_dispatcher"] is True
-
-            await orchestrator.shutdown()
-
-    def test_system_status_reporting(self, config_file_health):
-        """Test comprehensive system status reporting."""
-        with patch("ozb_deal_filter.components.llm_evaluator.LLMEvaluator"), patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ):
-            orchestrator = ApplicationOrchestrator(config_file_health)
-
-            # Set up test state
-            orchestrator._running = True
-            orchestrator._startup_time = datetime.now() - timedelta(hours=2)
-            orchestrator._component_health = {
-                "config_manager": True,
-                "rss_monitor": True,
-                "deal_parser": True,
-                "llm_evaluator": False,
-                "message_dispatcher": True,
-            }
-            orchestrator._error_counts = {
-                "llm_evaluation": 5,
-                "message_delivery": 2,
-                "main_loop": 1,
-            }
-            orchestrator._config = Mock()
-
-            # Get system status
+        for expected in (False, False, True):
+            await orchestrator._health_check(force=True)
             status = orchestrator.get_system_status()
+            assert status["component_health"]["message_dispatcher"] is expected
+
+    async def test_health_check_reuses_recent_result(self, bare_orchestrator):
+        """Test that back-to-back health checks within the TTL probe once."""
+        orchestrator = bare_orchestrator
+        orchestrator._rss_monitor = Mock(spec=RSSMonitor, is_monitoring=True)
+        orchestrator._message_dispatcher = Mock(spec=IMessageDispatcher)
+        orchestrator._message_dispatcher.test_connection = Mock(
+            spec=IMessageDispatcher.test_connection, return_value=True
+        )
+        orchestrator._component_health = {"message_dispatcher": True}
+        mock_test_connection = orchestrator._message_dispatcher.test_connection
+
+        await orchestrator._health_check()
+        await orchestrator._health_check()
+        assert mock_test_connection.call_count == 1
+
+        await orchestrator._health_check(force=True)
+        assert mock_test_connection.call_count == 2
+
+    def test_system_status_reuses_recent_snapshot(self, bare_orchestrator):
+        """Test that status is cached after startup until state changes."""
+        orchestrator = bare_orchestrator
+        orchestrator._startup_time = datetime.now()
+
+        status = orchestrator.get_system_status()
+        snapshot = orchestrator._status_cache
+        repeated = orchestrator.get_system_status()
+        assert repeated == status
+        assert repeated is not status
+        assert orchestrator._status_cache is snapshot
+
+        # Callers' edits must not reach the cached snapshot
+        status["running"] = True
+        status["component_health"]["rss_monitor"] = True
+        assert orchestrator.get_system_status() == repeated
+
+        orchestrator._increment_error_count("test_error")
+        refreshed = orchestrator.get_system_status()
+        assert refreshed["error_counts"] == {"test_error": 1}
+
+        orchestrator._component_health["rss_monitor"] = False
+        refreshed = orchestrator.get_system_status()
+        assert refreshed["component_health"] == {"rss_monitor": False}
+
+    def test_system_status_reporting(self, bare_orchestrator):
+        """Test comprehensive system status reporting."""
+        orchestrator = bare_orchestrator
+
+        # Set up test state
+        orchestrator._running = True
+        orchestrator._startup_time = datetime.now() - timedelta(hours=2)
+        orchestrator._component_health = {
+            "config_manager": True,
+            "rss_monitor": True,
+            "deal_parser": True,
+            "llm_evaluator": False,
+            "message_dispatcher": True,
+        }
+        orchestrator._error_counts = {
+            "llm_evaluation": 5,
+            "message_delivery": 2,
+            "main_loop": 1,
+        }
+        orchestrator._config = Mock(spec=Configuration)
+
+        # Get system status
+        status = orchestrator.get_system_status()
+
+        # Verify status structure
+        assert "running" in status
+        assert "startup_time" in status
+        assert "uptime" in status
+        assert "component_health" in status
+        assert "error_counts" in status
+        assert "config_loaded" in status
+
+        # Verify status values
+        assert status["running"] is True
+        assert status["startup_time"] is not None
+        assert status["uptime"] is not None
+        assert status["config_loaded"] is True
+
+        # Verify component health
+        assert len(status["component_health"]) == 5
+        assert status["component_health"]["llm_evaluator"] is False
+        assert status["component_health"]["message_dispatcher"] is True
+
+        # Verify error counts
+        assert status["error_counts"]["llm_evaluation"] == 5
+        assert status["error_counts"]["message_delivery"] == 2
+
+    def test_liveness_and_readiness(self, bare_orchestrator):
+        """Test that readiness tracks only the critical components."""
+        orchestrator = bare_orchestrator
+        assert orchestrator.get_liveness() == {"alive": False}
+
+        orchestrator._running = True
+        orchestrator._component_health = {
+            "config_manager": True,
+            "rss_monitor": True,
+            "deal_parser": True,
+            "llm_evaluator": False,
+        }
+        assert orchestrator.get_liveness() == {"alive": True}
+        assert orchestrator.is_ready()
+        assert orchestrator.get_system_status()["ready"] is True
 
-            # Verify status structure
-            assert "running" in status
-            assert "startup_time" in status
-            assert "uptime" in status
-            assert "component_health" in status
-            assert "error_counts" in status
-            assert "config_loaded" in status
-
-            # Verify status values
-            assert status["running"] is True
-            assert status["startup_time"] is not None
-            assert status["uptime"] is not None
-            assert status["config_loaded"] is True
-
-            # Verify component health
-            assert len(status["component_health"]) == 5
-            assert status["component_health"]["llm_evaluator"] is False
-            assert status["component_health"]["message_dispatcher"] is True
-
-            # Verify error counts
-            assert status["error_counts"]["llm_evaluation"] == 5
-            assert status["error_counts"]["message_delivery"] == 2
+        orchestrator._component_health["rss_monitor"] = False
+        assert not orchestrator.is_ready()
+        assert orchestrator.get_system_status()["ready"] is False
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="system_validation_metrics")
 class TestMetricsCollection:
     """Test performance metrics collection and tracking."""
 
-    @pytest.fixture
-    def metrics_config(self):
-        """Create configuration for metrics testing."""
-        return {
-            "rss_feeds": ["https://www.ozbargain.com.au/deals/feed"],
-            "user_criteria": {
-                "prompt_template": "prompts/deal_evaluator.example.txt",
-                "max_price": 500.0,
-                "min_discount_percentage": 20.0,
-                "categories": ["Electronics"],
-                "keywords": ["laptop"],
-                "min_authenticity_score": 0.6,
-            },
-            "llm_provider": {
-                "type": "local",
-                "local": {"model": "llama2", "docker_image": "ollama/ollama"},
-            },
-            "messaging_platform": {
-                "type": "telegram",
-                "telegram": {"bot_token": "test_token", "chat_id": "test_chat"},
-            },
-            "system": {
-                "polling_interval": 60,
-                "max_concurrent_feeds": 5,
-                "alert_timeout": 300,
-                "urgent_alert_timeout": 120,
-            },
-        }
-
-    @pytest.fixture
-    def config_file_metrics(self, metrics_config):
-        """Create config file for metrics tests."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(metrics_config, f)
-            return f.name
+    config_variant = "metrics"
 
-    def test_error_count_tracking(self, config_file_metrics):
+    def test_error_count_tracking(self, bare_orchestrator):
         """Test error count tracking functionality."""
-        with patch("ozb_deal_filter.components.llm_evaluator.LLMEvaluator"), patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ):
-            orchestrator = ApplicationOrchestrator(config_file_metrics)
+        orchestrator = bare_orchestrator
 
-            # Test error count increment
-            orchestrator._increment_error_count("test_error")
-            assert orchestrator._error_counts["test_error"] == 1
+        # Test error count increment
+        orchestrator._increment_error_count("test_error")
+        assert orchestrator._error_counts["test_error"] == 1
 
-            orchestrator._increment_error_count("test_error")
-            assert orchestrator._error_counts["test_error"] == 2
+        orchestrator._increment_error_count("test_error")
+        assert orchestrator._error_counts["test_error"] == 2
 
-            # Test multiple error types
-            orchestrator._increment_error_count("another_error")
-            assert orchestrator._error_counts["another_error"] == 1
-            assert orchestrator._error_counts["test_error"] == 2
+        # Test multiple error types
+        orchestrator._increment_error_count("another_error")
+        assert orchestrator._error_counts["another_error"] == 1
+        assert orchestrator._error_counts["test_error"] == 2
 
-            # Test high error count warning (should log warning at multiples of 10)
-            for i in range(8):  # Bring total to 10
-                orchestrator._increment_error_count("test_error")
+        # Test high error count warning (should log warning at multiples of 10)
+        for i in range(8):  # Bring total to 10
+            orchestrator._increment_error_count("test_error")
 
-            assert orchestrator._error_counts["test_error"] == 10
+        assert orchestrator._error_counts["test_error"] == 10
 
-    @pytest.mark.asyncio
-    async def test_performance_metrics_collection(self, config_file_metrics):
+    async def test_performance_metrics_collection(
+        self, initialized_orchestrator, mocked_components
+    ):
         """Test collection of performance metrics during operation."""
-        with patch("requests.get") as mock_get, patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock RSS response
-            rss_content = """<?xml version="1.0"?>
-            <rss version="2.0">
-                <channel>
-                    <item>
-                        <title>Test Laptop Deal</title>
-                        <description>Great laptop deal</description>
-                        <link>https://example.com/deal</link>
-                        <pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>
-                        <category>Electronics</category>
-                    </item>
-                </channel>
-            </rss>"""
-
-            mock_response = Mock()
-            mock_response.text = rss_content
-            mock_response.status_code = 200
-            mock_response.raise_for_status = Mock()
-            mock_get.return_value = mock_response
-
-            # Mock LLM with timing
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-
-            evaluation_times = []
-
-            async def timed_evaluate_deal(deal):
-                start_time = time.time()
-                await asyncio.sleep(0.05)  # 50ms processing
-                end_time = time.time()
-                evaluation_times.append(end_time - start_time)
-                return EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
-
-            mock_llm.evaluate_deal = timed_evaluate_deal
-
-            # Mock message dispatcher with timing
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            delivery_times = []
-
-            async def timed_send_alert(alert):
-                start_time = time.time()
-                await asyncio.sleep(0.02)  # 20ms delivery
-                end_time = time.time()
-                delivery_times.append(end_time - start_time)
-                return DeliveryResult(
-                    success=True,
-                    delivery_time=datetime.now(timezone.utc),
-                    error_message=None,
-                )
-
-            mock_dispatcher.send_alert = timed_send_alert
-
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_metrics)
-            await orchestrator.initialize()
+        orchestrator = initialized_orchestrator
 
-            # Process multiple deals to collect metrics
-            for i in range(5):
-                raw_deal = RawDeal(
-                    title=f"Test Laptop Deal {i}",
-                    description="Great laptop deal",
-                    link=f"https://example.com/deal{i}",
-                    pub_date="Mon, 01 Jan 2024 12:00:00 GMT",
-                    category="Electronics",
-                )
+        # Mock LLM with timing
+        mock_llm = mocked_components.llm
 
-                await orchestrator._process_single_deal(raw_deal)
+        evaluation_times = []
+        eval_clock = _FakeClock(0.05)  # 50ms processing
 
-            # Verify metrics were collected
-            assert len(evaluation_times) == 5
-            assert len(delivery_times) == 5
+        async def timed_evaluate_deal(deal, prompt_template):
+            start_time = eval_clock()
+            end_time = eval_clock()
+            evaluation_times.append(end_time - start_time)
+            return _RELEVANT_EVAL
 
-            # Verify timing ranges
-            assert all(0.04 < t < 0.06 for t in evaluation_times)  # ~50ms
-            assert all(0.01 < t < 0.03 for t in delivery_times)  # ~20ms
+        mock_llm.evaluate_deal = timed_evaluate_deal
 
-            # Calculate performance statistics
-            import statistics
+        # Mock message dispatcher with timing
+        mock_dispatcher = mocked_components.dispatcher
 
-            avg_eval_time = statistics.mean(evaluation_times)
-            avg_delivery_time = statistics.mean(delivery_times)
+        delivery_times = []
+        delivery_clock = _FakeClock(0.02)  # 20ms delivery
 
-            print(f"Average evaluation time: {avg_eval_time:.3f}s")
-            print(f"Average delivery time: {avg_delivery_time:.3f}s")
+        def timed_send_alert(alert):
+            start_time = delivery_clock()
+            end_time = delivery_clock()
+            delivery_times.append(end_time - start_time)
+            return _SUCCESS_DELIVERY
 
-            await orchestrator.shutdown()
+        mock_dispatcher.send_alert = timed_send_alert
 
-    @pytest.mark.asyncio
-    async def test_uptime_tracking(self, config_file_metrics):
-        """Test system uptime tracking."""
-        with patch("ozb_deal_filter.components.llm_evaluator.LLMEvaluator"), patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ):
-            orchestrator = ApplicationOrchestrator(config_file_metrics)
+        # Process multiple deals concurrently to collect metrics
+        raw_deals = [
+            replace(
+                _LAPTOP_DEAL,
+                title=f"{_LAPTOP_DEAL.title} {i}",
+                link=f"{_LAPTOP_DEAL.link}{i}",
+            )
+            for i in range(5)
+        ]
 
-            # Set startup time
-            start_time = datetime.now() - timedelta(minutes=30)
-            orchestrator._startup_time = start_time
+        await asyncio.gather(
+            *(orchestrator._process_single_deal(deal) for deal in raw_deals)
+        )
 
-            # Get status and check uptime
-            status = orchestrator.get_system_status()
+        # Verify metrics were collected within the expected timing ranges
+        assert len(evaluation_times) == 5
+        assert len(delivery_times) == 5
+        for eval_time, delivery_time in zip(evaluation_times, delivery_times):
+            assert 0.04 < eval_time < 0.06  # ~50ms
+            assert 0.01 < delivery_time < 0.03  # ~20ms
+
+        # Calculate performance statistics
+        import statistics
+
+        avg_eval_time = statistics.mean(evaluation_times)
+        avg_delivery_time = statistics.mean(delivery_times)
+
+        print(f"Average evaluation time: {avg_eval_time:.3f}s")
+        print(f"Average delivery time: {avg_delivery_time:.3f}s")
+
+    async def test_uptime_tracking(self, freeze_datetime, bare_orchestrator):
+        """Test system uptime tracking."""
+        freeze_datetime(orchestrator_module, _FROZEN_LOCAL_NOW)
+        orchestrator = bare_orchestrator
+
+        # Set startup time
+        start_time = _FROZEN_LOCAL_NOW - timedelta(minutes=30)
+        orchestrator._startup_time = start_time
 
-            assert status["startup_time"] == start_time.isoformat()
-            assert status["uptime"] is not None
+        # Get status and check uptime
+        status = orchestrator.get_system_status()
 
-            # Parse uptime string and verify it's approximately 30 minutes
-            uptime_str = status["uptime"]
-            assert (
-                "0:30:" in uptime_str or "0:29:" in uptime_str
-            )  # Allow for small timing differences
+        assert status["startup_time"] == start_time.isoformat()
+        assert status["uptime"] == "0:30:00"
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="system_validation_delivery")
 class TestAlertDeliveryValidation:
     """Test alert delivery validation and tracking."""
 
-    @pytest.fixture
-    def delivery_config(self):
-        """Create configuration for delivery testing."""
-        return {
-            "rss_feeds": ["https://www.ozbargain.com.au/deals/feed"],
-            "user_criteria": {
-                "prompt_template": "prompts/deal_evaluator.example.txt",
-                "max_price": 500.0,
-                "min_discount_percentage": 20.0,
-                "categories": ["Electronics"],
-                "keywords": ["laptop"],
-                "min_authenticity_score": 0.6,
-            },
-            "llm_provider": {
-                "type": "local",
-                "local": {"model": "llama2", "docker_image": "ollama/ollama"},
-            },
-            "messaging_platform": {
-                "type": "telegram",
-                "telegram": {"bot_token": "test_token", "chat_id": "test_chat"},
-            },
-            "system": {
-                "polling_interval": 60,
-                "max_concurrent_feeds": 5,
-                "alert_timeout": 300,
-                "urgent_alert_timeout": 120,
-            },
-        }
+    config_variant = "delivery"
 
-    @pytest.fixture
-    def config_file_delivery(self, delivery_config):
-        """Create config file for delivery tests."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(delivery_config, f)
-            return f.name
-
-    @pytest.mark.asyncio
-    async def test_successful_alert_delivery_tracking(self, config_file_delivery):
+    async def test_successful_alert_delivery_tracking(
+        self, initialized_orchestrator, mocked_components
+    ):
         """Test tracking of successful alert deliveries."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock LLM evaluator
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(
-                return_value=EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
-            )
+        orchestrator = initialized_orchestrator
 
-            # Track delivery results
-            delivery_results = []
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            async def track_delivery(alert):
-                result = DeliveryResult(
-                    success=True,
-                    delivery_time=datetime.now(timezone.utc),
-                    error_message=None,
-                )
-                delivery_results.append(result)
-                return result
-
-            mock_dispatcher.send_alert = track_delivery
-
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_delivery)
-            await orchestrator.initialize()
+        # Track delivery results
+        delivery_results = []
+        mock_dispatcher = mocked_components.dispatcher
 
-            # Process test deals
-            test_deals = [
-                RawDeal(
-                    title="Laptop Deal 1",
-                    description="Great laptop",
-                    link="https://example.com/deal1",
-                    pub_date="Mon, 01 Jan 2024 12:00:00 GMT",
-                    category="Electronics",
-                ),
-                RawDeal(
-                    title="Laptop Deal 2",
-                    description="Another laptop",
-                    link="https://example.com/deal2",
-                    pub_date="Mon, 01 Jan 2024 12:01:00 GMT",
-                    category="Electronics",
-                ),
-            ]
-
-            for deal in test_deals:
-                await orchestrator._process_single_deal(deal)
-
-            # Verify deliveries were tracked
-            assert len(delivery_results) == 2
-            assert all(result.success for result in delivery_results)
-            assert all(result.error_message is None for result in delivery_results)
-            assert all(result.delivery_time is not None for result in delivery_results)
-
-            # Verify no delivery errors were counted
-            assert orchestrator._error_counts.get("message_delivery", 0) == 0
-
-            await orchestrator.shutdown()
-
-    @pytest.mark.asyncio
-    async def test_failed_alert_delivery_tracking(self, config_file_delivery):
-        """Test tracking of failed alert deliveries."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock LLM evaluator
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(
-                return_value=EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
+        def track_delivery(alert):
+            result = _SUCCESS_DELIVERY
+            delivery_results.append(result)
+            return result
+
+        mock_dispatcher.send_alert = track_delivery
+
+        # Process test deals
+        test_deals = [
+            replace(
+                _LAPTOP_DEAL,
+                title=f"Laptop Deal {i}",
+                link=f"https://example.com/deal{i}",
             )
+            for i in (1, 2)
+        ]
+
+        await asyncio.gather(
+            *(orchestrator._process_single_deal(deal) for deal in test_deals)
+        )
+
+        # Verify deliveries were tracked
+        assert len(delivery_results) == 2
+        for result in delivery_results:
+            assert result.success
+            assert result.error_message is None
+            assert result.delivery_time is not None
+
+        # Verify no delivery errors were counted
+        assert orchestrator._error_counts.get("message_delivery", 0) == 0
+
+    async def test_failed_alert_delivery_tracking(
+        self, initialized_orchestrator, mocked_components
+    ):
+        """Test tracking of failed alert deliveries."""
+        orchestrator = initialized_orchestrator
 
-            # Mock failing message dispatcher
-            delivery_attempts = []
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            async def failing_delivery(alert):
-                result = DeliveryResult(
-                    success=False,
-                    delivery_time=datetime.now(timezone.utc),
-                    error_message="Network timeout",
-                )
-                delivery_attempts.append(result)
-                return result
-
-            mock_dispatcher.send_alert = failing_delivery
-
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_delivery)
-            await orchestrator.initialize()
+        # Mock failing message dispatcher
+        delivery_attempts = []
+        mock_dispatcher = mocked_components.dispatcher
 
-            # Process test deal
-            test_deal = RawDeal(
-                title="Laptop Deal",
-                description="Great laptop",
-                link="https://example.com/deal",
-                pub_date="Mon, 01 Jan 2024 12:00:00 GMT",
-                category="Electronics",
+        def failing_delivery(alert):
+            result = DeliveryResult(
+                success=False,
+                delivery_time=_FIXED_NOW,
+                error_message="Network timeout",
             )
+            delivery_attempts.append(result)
+            return result
+
+        mock_dispatcher.send_alert = failing_delivery
 
-            await orchestrator._process_single_deal(test_deal)
+        # Process test deal
+        test_deal = RawDeal(
+            title="Laptop Deal",
+            description="Great laptop",
+            link="https://example.com/deal",
+            pub_date="Mon, 01 Jan 2024 12:00:00 GMT",
+            category="Electronics",
+        )
 
-            # Verify failure was tracked
-            assert len(delivery_attempts) == 1
-            assert not delivery_attempts[0].success
-            assert delivery_attempts[0].error_message == "Network timeout"
+        await orchestrator._process_single_deal(test_deal)
 
-            # Verify error count was incremented
-            assert orchestrator._error_counts.get("message_delivery", 0) == 1
+        # Verify failure was tracked
+        assert len(delivery_attempts) == 1
+        assert not delivery_attempts[0].success
+        assert delivery_attempts[0].error_message == "Network timeout"
 
-            await orchestrator.shutdown()
+        # Verify error count was incremented
+        assert orchestrator._error_counts.get("message_delivery", 0) == 1
 
-    @pytest.mark.asyncio
-    async def test_delivery_timeout_validation(self, config_file_delivery):
+    async def test_delivery_timeout_validation(
+        self, initialized_orchestrator, mocked_components
+    ):
         """Test validation of delivery timeouts."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock LLM evaluator
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(
-                return_value=EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
-            )
+        orchestrator = initialized_orchestrator
 
-            # Mock slow message dispatcher
-            delivery_times = []
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            async def slow_delivery(alert):
-                start_time = time.time()
-                await asyncio.sleep(0.1)  # 100ms delay
-                end_time = time.time()
-
-                result = DeliveryResult(
-                    success=True,
-                    delivery_time=datetime.now(timezone.utc),
-                    error_message=None,
-                )
-                delivery_times.append(end_time - start_time)
-                return result
-
-            mock_dispatcher.send_alert = slow_delivery
-
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_delivery)
-            await orchestrator.initialize()
+        # Mock slow message dispatcher
+        delivery_times = []
+        delivery_clock = _FakeClock(0.1)  # 100ms delay
+        mock_dispatcher = mocked_components.dispatcher
 
-            # Process urgent deal
-            urgent_deal = RawDeal(
-                title="URGENT: Laptop Deal - Limited Time!",
-                description="Stock running low!",
-                link="https://example.com/urgent-deal",
-                pub_date="Mon, 01 Jan 2024 12:00:00 GMT",
-                category="Electronics",
-            )
+        def slow_delivery(alert):
+            start_time = delivery_clock()
+            end_time = delivery_clock()
 
-            start_time = time.time()
-            await orchestrator._process_single_deal(urgent_deal)
-            total_time = time.time() - start_time
+            result = _SUCCESS_DELIVERY
+            delivery_times.append(end_time - start_time)
+            return result
 
-            # Verify delivery timing
-            assert len(delivery_times) == 1
-            assert delivery_times[0] >= 0.1  # At least 100ms as expected
+        mock_dispatcher.send_alert = slow_delivery
 
-            # For urgent deals, total processing should be reasonable
-            assert total_time < 1.0  # Less than 1 second total
+        # Process urgent deal
+        urgent_deal = RawDeal(
+            title="URGENT: Laptop Deal - Limited Time!",
+            description="Stock running low!",
+            link="https://example.com/urgent-deal",
+            pub_date="Mon, 01 Jan 2024 12:00:00 GMT",
+            category="Electronics",
+        )
 
-            await orchestrator.shutdown()
+        start_time = time.time()
+        await orchestrator._process_single_deal(urgent_deal)
+        total_time = time.time() - start_time
+
+        # Verify delivery timing
+        assert len(delivery_times) == 1
+        assert delivery_times[0] >= 0.1  # At least 100ms as expected
+
+        # For urgent deals, total processing should be reasonable
+        assert total_time < 1.0  # Less than 1 second total
 
 
 @pytest.mark.integration
 class TestSystemStartupValidation:
     """Test system startup validation and initialization checks."""
 
-    @pytest.fixture
-    def startup_config(self):
-        """Create configuration for startup testing."""
-        return {
-            "rss_feeds": [
-                "https://www.ozbargain.com.au/deals/feed",
-                "https://www.ozbargain.com.au/cat/computing/feed",
-            ],
-            "user_criteria": {
-                "prompt_template": "prompts/deal_evaluator.example.txt",
-                "max_price": 500.0,
-                "min_discount_percentage": 20.0,
-                "categories": ["Electronics", "Computing"],
-                "keywords": ["laptop", "phone"],
-                "min_authenticity_score": 0.6,
-            },
-            "llm_provider": {
-                "type": "local",
-                "local": {"model": "llama2", "docker_image": "ollama/ollama"},
-            },
-            "messaging_platform": {
-                "type": "telegram",
-                "telegram": {"bot_token": "test_token", "chat_id": "test_chat"},
-            },
-            "system": {
-                "polling_interval": 60,
-                "max_concurrent_feeds": 5,
-                "alert_timeout": 300,
-                "urgent_alert_timeout": 120,
-            },
-        }
+    config_variant = "startup"
 
-    @pytest.fixture
-    def config_file_startup(self, startup_config):
-        """Create config file for startup tests."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(startup_config, f)
-            return f.name
-
-    @pytest.mark.asyncio
-    async def test_successful_system_startup(self, config_file_startup):
+    async def test_successful_system_startup(self, orchestrator, mocked_components):
         """Test successful system startup and initialization."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock successful components
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(
-                return_value=EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
-            )
-
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_startup)
-
-            # Test initialization
-            start_time = time.time()
-            init_success = await orchestrator.initialize()
-            init_time = time.time() - start_time
-
-            # Verify successful initialization
-            assert init_success is True
-            assert init_time < 5.0  # Should initialize within 5 seconds
-            assert orchestrator._startup_time is not None
-
-            # Verify all components are healthy
-            status = orchestrator.get_system_status()
-            assert status["config_loaded"] is True
-            assert all(health for health in status["component_health"].values())
-
-            await orchestrator.shutdown()
-
-    @pytest.mark.asyncio
-    async def test_startup_with_component_failures(self, config_file_startup):
-        """Test startup behavior when some components fail."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock LLM failure
-            mock_llm_class.side_effect = Exception("LLM initialization failed")
-
-            # Mock successful message dispatcher
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_startup)
-
-            # Test initialization (should still succeed with degraded functionality)
-            init_success = await orchestrator.initialize()
+        # Test initialization
+        start_time = time.time()
+        init_success = await orchestrator.initialize()
+        init_time = time.time() - start_time
+
+        # Verify successful initialization
+        assert init_success is True
+        assert init_time < 5.0  # Should initialize within 5 seconds
+        assert orchestrator._startup_time is not None
+
+        # Verify all components are healthy
+        status = orchestrator.get_system_status()
+        assert status["config_loaded"] is True
+        assert not any(h is False for h in status["component_health"].values())
+        assert orchestrator.is_ready()
+
+    async def test_startup_aborts_when_llm_evaluator_cannot_be_built(
+        self, orchestrator, mocked_components
+    ):
+        """Test startup fails fast when the LLM evaluator cannot be constructed."""
+        # Mock LLM failure
+        mocked_components.llm_class.side_effect = Exception("LLM initialization failed")
+
+        # Construction failures abort initialization
+        init_success = await orchestrator.initialize()
+
+        assert init_success is False
+        assert orchestrator._startup_time is None
+
+    async def test_startup_with_failing_llm_probe(
+        self, orchestrator, mocked_components
+    ):
+        """Test that an LLM test evaluation raising only degrades startup."""
+        with patch.object(
+            EvaluationService,
+            "evaluate_deal",
+            side_effect=Exception("LLM unavailable"),
+        ):
+            assert await orchestrator.initialize() is True
 
-            # System should still initialize (non-critical component failure)
-            assert init_success is True
+        status = orchestrator.get_system_status()
+        assert status["component_health"]["llm_evaluator"] is False
+        assert status["component_health"]["message_dispatcher"] is True
 
-            # Verify component health reflects the failure
-            status = orchestrator.get_system_status()
-            assert status["component_health"]["llm_evaluator"] is False
-            assert status["component_health"]["message_dispatcher"] is True
+    async def test_startup_with_raising_dispatcher_probe(
+        self, orchestrator, mocked_components
+    ):
+        """Test that a dispatcher connection test raising fails startup."""
+        mocked_components.dispatcher.test_connection.side_effect = Exception(
+            "Telegram unreachable"
+        )
 
-            await orchestrator.shutdown()
+        assert await orchestrator.initialize() is False
+        assert orchestrator._startup_time is None
 
-    @pytest.mark.asyncio
-    async def test_startup_with_critical_component_failure(self, config_file_startup):
+    async def test_startup_with_critical_component_failure(self, orchestrator):
         """Test startup behavior when critical components fail."""
         with patch(
-            "ozb_deal_filter.services.config_manager.ConfigurationManager"
+            "ozb_deal_filter.orchestrator.ConfigurationManager"
         ) as mock_config_mgr:
             # Mock critical component failure (config manager)
             mock_config_mgr.side_effect = Exception("Configuration loading failed")
 
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_startup)
-
             # Test initialization (should fail)
             init_success = await orchestrator.initialize()
 
@@ -821,112 +766,49 @@ class TestSystemStartupValidation:
             assert init_success is False
             assert orchestrator._startup_time is None
 
-    @pytest.mark.asyncio
-    async def test_startup_validation_checks(self, config_file_startup):
+    async def test_startup_validation_checks(self, orchestrator, mocked_components):
         """Test comprehensive startup validation checks."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock components
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-            mock_llm.evaluate_deal = AsyncMock(
-                return_value=EvaluationResult(
-                    is_relevant=True,
-                    confidence_score=0.8,
-                    reasoning="Test evaluation",
-                )
-            )
+        # Initialize system
+        await orchestrator.initialize()
 
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
+        # Validate startup state
+        status = orchestrator.get_system_status()
 
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_startup)
+        # Check required status fields
+        missing_fields = _REQUIRED_STATUS_FIELDS - status.keys()
+        assert not missing_fields, f"Missing status fields: {sorted(missing_fields)}"
 
-            # Initialize system
-            await orchestrator.initialize()
+        # Check component health structure
+        missing_components = _EXPECTED_COMPONENTS - status["component_health"].keys()
+        assert (
+            not missing_components
+        ), f"Missing component health: {sorted(missing_components)}"
 
-            # Validate startup state
-            status = orchestrator.get_system_status()
+        # Verify configuration was loaded
+        assert orchestrator._config is not None
+        assert len(orchestrator._config.rss_feeds) == 2
+        assert orchestrator._config.user_criteria.max_price == 500.0
 
-            # Check required status fields
-            required_fields = [
-                "running",
-                "startup_time",
-                "uptime",
-                "component_health",
-                "error_counts",
-                "config_loaded",
-            ]
-
-            for field in required_fields:
-                assert field in status, f"Missing required status field: {field}"
-
-            # Check component health structure
-            expected_components = [
-                "config_manager",
-                "rss_monitor",
-                "deal_parser",
-                "llm_evaluator",
-                "evaluation_service",
-                "alert_formatter",
-                "message_dispatcher",
-            ]
-
-            for component in expected_components:
-                assert (
-                    component in status["component_health"]
-                ), f"Missing component health: {component}"
-
-            # Verify configuration was loaded
-            assert orchestrator._config is not None
-            assert len(orchestrator._config.rss_feeds) == 2
-            assert orchestrator._config.user_criteria.max_price == 500.0
-
-            await orchestrator.shutdown()
-
-    def test_startup_timing_requirements(self, config_file_startup):
+    async def test_startup_timing_requirements(self, orchestrator, mocked_components):
         """Test that startup meets timing requirements."""
-        with patch(
-            "ozb_deal_filter.components.llm_evaluator.LLMEvaluator"
-        ) as mock_llm_class, patch(
-            "ozb_deal_filter.components.message_dispatcher.MessageDispatcherFactory"
-        ) as mock_dispatcher_factory:
-            # Mock fast components
-            mock_llm = Mock()
-            mock_llm_class.return_value = mock_llm
-
-            mock_dispatcher = Mock()
-            mock_dispatcher_factory.create_dispatcher.return_value = mock_dispatcher
-            mock_dispatcher.test_connection.return_value = True
-
-            # Create orchestrator
-            orchestrator = ApplicationOrchestrator(config_file_startup)
-
-            # Measure initialization time
-            start_time = time.time()
-
-            # Run initialization synchronously for timing
-            import asyncio
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                init_success = loop.run_until_complete(orchestrator.initialize())
-                init_time = time.time() - start_time
-
-                # Verify timing requirements
-                assert init_success is True
-                assert init_time < 10.0  # Should initialize within 10 seconds
+        looptime = pytest.importorskip("looptime")
+
+        # Measure on the shared loop's clock with time compaction enabled, so
+        # sleeps and timeouts inside initialize() are fast-forwarded. The
+        # looptime marker would need pytest-asyncio 1.0+ to take effect.
+        # The wall clock still catches slow synchronous work, which loop time
+        # does not advance for.
+        loop = asyncio.get_running_loop()
+        wall_start = time.perf_counter()
+        with looptime.enabled(strict=True):
+            start_time = loop.time()
+            init_success = await orchestrator.initialize()
+            init_time = loop.time() - start_time
+        wall_time = time.perf_counter() - wall_start
 
-                print(f"System initialization time: {init_time:.2f}s")
+        # Verify timing requirements
+        assert init_success is True
+        assert init_time < 10.0  # Should initialize within 10 seconds
+        assert wall_time < 10.0
 
-                # Cleanup
-                loop.run_until_complete(orchestrator.shutdown())
-            finally:
-                loop.close()
+        print(f"System initialization time: {init_time:.2f}s ({wall_time:.2f}s real)")
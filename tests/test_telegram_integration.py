@@ -8,6 +8,7 @@ import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 
 from ozb_deal_filter.components.feed_command_processor import FeedCommandProcessor
@@ -17,11 +18,14 @@ from ozb_deal_filter.services.dynamic_feed_manager import DynamicFeedManager
 from ozb_deal_filter.services.telegram_authorizer import TelegramAuthorizer
 from ozb_deal_filter.utils.url_validator import URLValidator
 
+# Fixed timestamp for FeedConfig fixtures; nothing here depends on the real clock
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestTelegramIntegration:
     """Test Telegram integration functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_rss_monitor(self):
         """Mock RSS monitor for testing."""
         mock_monitor = MagicMock()
@@ -36,7 +40,7 @@ class TestTelegramIntegration:
         }
         return mock_monitor
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_feed_manager(self):
         """Mock dynamic feed manager for testing."""
         mock_manager = MagicMock()
@@ -47,19 +51,26 @@ class TestTelegramIntegration:
                 url="https://example.com/feed.xml",
                 name="Example Feed",
                 added_by="user123",
-                added_at=datetime.now(),
+                added_at=_FROZEN_NOW,
                 enabled=True,
             )
         ]
         return mock_manager
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def command_processor(self, mock_rss_monitor, mock_feed_manager):
         """Create command processor with mocked dependencies."""
         return FeedCommandProcessor(
             rss_monitor=mock_rss_monitor, feed_manager=mock_feed_manager
         )
 
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_rss_monitor, mock_feed_manager):
+        """Clear recorded calls on the shared mocks; configured returns are kept."""
+        yield
+        mock_rss_monitor.reset_mock()
+        mock_feed_manager.reset_mock()
+
     @pytest.mark.asyncio
     async def test_add_feed_command(self, command_processor):
         """Test adding a feed via command processor."""
@@ -92,6 +103,47 @@ class TestTelegramIntegration:
             assert "Feed added successfully" in result.message
             assert "My Test Feed" in result.message
 
+    @pytest.mark.asyncio
+    async def test_open_processor_shares_validator_session(
+        self, mock_rss_monitor, mock_feed_manager
+    ):
+        """Test that an open processor keeps one validator session until closed."""
+        with patch(
+            "ozb_deal_filter.utils.url_validator.aiohttp.ClientSession",
+            wraps=aiohttp.ClientSession,
+        ) as session_class, patch.object(
+            URLValidator,
+            "validate_url",
+            AsyncMock(
+                return_value=ValidationResult(is_valid=True, feed_title="Test Feed")
+            ),
+        ):
+            async with FeedCommandProcessor(
+                rss_monitor=mock_rss_monitor, feed_manager=mock_feed_manager
+            ) as processor:
+                session = processor.url_validator.session
+                assert session is not None
+
+                for index in range(2):
+                    url = f"https://example.com/shared-{index}.xml"
+                    result = await processor.add_feed(
+                        BotCommand(
+                            command="add_feed",
+                            args=[url],
+                            user_id="user123",
+                            chat_id="chat123",
+                            raw_text=f"/add_feed {url}",
+                        )
+                    )
+                    assert result.success
+
+                assert session_class.call_count == 1
+                assert processor.url_validator.session is session
+                assert not session.closed
+
+        assert processor.url_validator.session is None
+        assert session.closed
+
     @pytest.mark.asyncio
     async def test_list_feeds_command(self, command_processor):
         """Test listing feeds via command processor."""
@@ -186,6 +238,11 @@ class TestTelegramIntegration:
         result = validator._validate_security("http://localhost/feed.xml")
         assert not result.is_valid
 
+        # Test combined format and security validation
+        assert validator._validate("https://example.com/feed.xml").is_valid
+        assert not validator._validate("ftp://example.com/feed.xml").is_valid
+        assert not validator._validate("http://localhost/feed.xml").is_valid
+
     def test_feed_config_validation(self):
         """Test FeedConfig validation."""
         # Valid config
@@ -193,7 +250,7 @@ class TestTelegramIntegration:
             url="https://example.com/feed.xml",
             name="Test Feed",
             added_by="user123",
-            added_at=datetime.now(),
+            added_at=_FROZEN_NOW,
             enabled=True,
         )
         assert config.validate()
@@ -203,7 +260,7 @@ class TestTelegramIntegration:
             url="not-a-url",
             name="Test Feed",
             added_by="user123",
-            added_at=datetime.now(),
+            added_at=_FROZEN_NOW,
             enabled=True,
         )
         assert not config_invalid.validate()
@@ -2,7 +2,8 @@
 """
 Token verification helper
 """
-import requests
+import http.client
+import json
 
 # Please paste your bot token here exactly as shown in BotFather:
 BOT_TOKEN = input("Please paste your bot token from BotFather: ").strip()
@@ -19,13 +20,19 @@ print(
 
 # Test the token
 
-url = f"https://api.telegram.org/bot{BOT_TOKEN}/getMe"
 try:
-    response = requests.get(url, timeout=10)
-    print(f"\n📡 API Response: {response.status_code}")
+    conn = http.client.HTTPSConnection("api.telegram.org", timeout=10)
+    try:
+        conn.request("GET", f"/bot{BOT_TOKEN}/getMe")
+        response = conn.getresponse()
+        body = response.read().decode("utf-8", errors="replace")
+    finally:
+        conn.close()
 
-    if response.status_code == 200:
-        result = response.json()
+    print(f"\n📡 API Response: {response.status}")
+
+    if response.status == 200:
+        result = json.loads(body)
         if result.get("ok"):
             bot_info = result["result"]
             print("✅ SUCCESS! Bot details:")
@@ -35,7 +42,7 @@ try:
         else:
             print(f"❌ API Error: {result}")
     else:
-        print(f"❌ HTTP Error: {response.text}")
+        print(f"❌ HTTP Error: {body}")
 
 except Exception as e:
     print(f"❌ Network Error: {e}")